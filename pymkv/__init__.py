@@ -7,9 +7,12 @@ from pymkv.file import MKVFile
 from pymkv.timestamp import Timestamp
 from pymkv.track import MKVTrack
 from pymkv.verifications import verify_matroska
+from pymkv.verifications import verify_matroska_async
 from pymkv.verifications import verify_mkvmerge
 from pymkv.verifications import verify_recognized
+from pymkv.verifications import verify_recognized_async
 from pymkv.verifications import verify_supported
+from pymkv.verifications import verify_supported_async
 
 __all__ = [
     "MKVAttachment",
@@ -17,7 +20,10 @@ __all__ = [
     "MKVTrack",
     "Timestamp",
     "verify_matroska",
+    "verify_matroska_async",
     "verify_mkvmerge",
     "verify_recognized",
+    "verify_recognized_async",
     "verify_supported",
+    "verify_supported_async",
 ]
@@ -0,0 +1,80 @@
+"""Persistent cache of mkvmerge identification output.
+
+The cache is off by default and is enabled by setting the ``PYMKV_CACHE`` environment variable to ``1``. Entries are
+stored in an SQLite database under ``$XDG_CACHE_HOME/pymkv`` (``~/.cache/pymkv`` if unset) and are keyed on the
+mkvmerge path, the file's absolute path, its modification time and its size, so a rewritten file misses the cache.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+_connection = None
+_lock = threading.Lock()
+
+
+def enabled():
+    """Return whether the persistent cache has been enabled with ``PYMKV_CACHE=1``."""
+    return os.environ.get("PYMKV_CACHE") == "1"
+
+
+def cache_path():
+    """Return the path of the cache database.
+
+    Raises RuntimeError if ``XDG_CACHE_HOME`` is unset and the home directory cannot be determined.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "pymkv" / "identify.sqlite3"
+
+
+def _connect():
+    global _connection  # noqa: PLW0603
+    if _connection is None:
+        path = cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # access is serialized by _lock, the connection is shared between threads
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS identification (key TEXT PRIMARY KEY, output BLOB NOT NULL)")
+        _connection = connection
+    return _connection
+
+
+def key(file_path, mkvmerge_path, mtime_ns, size):
+    """Build the cache key of an identification."""
+    return f"{mkvmerge_path}|{file_path}|{mtime_ns}|{size}"
+
+
+def get(cache_key):
+    """Return the cached mkvmerge output for `cache_key`, or None if there is none.
+
+    The cache is only an optimization, an unusable database is treated as a miss.
+    """
+    try:
+        with _lock:
+            row = _connect().execute("SELECT output FROM identification WHERE key = ?", (cache_key,)).fetchone()
+    except (OSError, RuntimeError, sqlite3.Error):
+        return None
+    return None if row is None else row[0]
+
+
+def put(cache_key, output):
+    """Store the mkvmerge output for `cache_key`, ignoring a database that cannot be written."""
+    try:
+        with _lock:
+            connection = _connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO identification VALUES (?, ?)", (cache_key, output))
+    except (OSError, RuntimeError, sqlite3.Error):
+        pass
+
+
+def close():
+    """Close the cache database, it is reopened on the next use."""
+    global _connection  # noqa: PLW0603
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
@@ -56,14 +56,46 @@ class MKVAttachment:
         which will attach to all files.
     """
 
+    __slots__ = ("_attach_once", "_command", "_description", "_file_path", "_mime_type", "_name")
+
     def __init__(self, file_path, name=None, description=None, attach_once=False):
-        self.mime_type = None
+        # generated arguments, cleared whenever an attribute they depend on changes
+        self._command = None
+        self._mime_type = None
+        self._name = None
+        self._description = None
+        self._attach_once = False
         self._file_path = None
         self.file_path = file_path
         self.name = name
         self.description = description
         self.attach_once = attach_once
 
+    def command(self):
+        """Generates the mkvmerge arguments that include this attachment when muxing an :class:`~pymkv.MKVFile`.
+
+        The arguments are generated once and reused until one of the attachment's attributes changes.
+
+        Returns
+        -------
+        list of str
+            The attachment options followed by the attach option for the attachment file.
+        """
+        if self._command is None:
+            command = []
+            # info
+            if self.name is not None:
+                command += ("--attachment-name", self.name)
+            if self.description is not None:
+                command += ("--attachment-description", self.description)
+            if self.mime_type is not None:
+                command += ("--attachment-mime-type", self.mime_type)
+
+            # add path
+            command += ("--attach-file-once" if self.attach_once else "--attach-file", self.file_path)
+            self._command = tuple(command)
+        return list(self._command)
+
     @property
     def file_path(self):
         """str: The path to the attachment file.
@@ -83,3 +115,44 @@ class MKVAttachment:
         self.mime_type = guess_type(file_path)[0]
         self.name = None
         self._file_path = file_path
+        self._command = None
+
+    @property
+    def mime_type(self):
+        """str: The attachment's MIME type, guessed when :attr:`~pymkv.MKVAttachment.file_path` is set."""
+        return self._mime_type
+
+    @mime_type.setter
+    def mime_type(self, mime_type):
+        self._mime_type = mime_type
+        self._command = None
+
+    @property
+    def name(self):
+        """str: The name that will be given to the attachment when muxed into a file."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+        self._command = None
+
+    @property
+    def description(self):
+        """str: The description that will be given to the attachment when muxed into a file."""
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        self._description = description
+        self._command = None
+
+    @property
+    def attach_once(self):
+        """bool: Determines if the attachment should be added to all split files or only the first."""
+        return self._attach_once
+
+    @attach_once.setter
+    def attach_once(self, attach_once):
+        self._attach_once = attach_once
+        self._command = None
@@ -35,22 +35,48 @@ Combine two MKVs. This example takes two existing MKVs and combines their tracks
 >>> mkv1.mux('/path/to/output.mkv')
 """
 
-import json
 import subprocess as sp
 from collections.abc import Iterable
-from os import devnull
+from itertools import chain
+from operator import attrgetter
 from os.path import expanduser
 from os.path import isfile
+from typing import Final
 
 import bitmath
 
 from pymkv.attachment import MKVAttachment
 from pymkv.timestamp import Timestamp
+from pymkv.timestamp import format_seconds
 from pymkv.track import MKVTrack
+from pymkv.utils import identify
 from pymkv.utils import is_iso_639_2_language_code
 from pymkv.verifications import verify_matroska
 from pymkv.verifications import verify_mkvmerge
 
+# mkvmerge options used by command() and the split and link methods
+_FLAG_OUTPUT: Final[str] = "-o"
+_FLAG_TITLE: Final[str] = "--title"
+_FLAG_CHAPTER_LANGUAGE: Final[str] = "--chapter-language"
+_FLAG_CHAPTERS: Final[str] = "--chapters"
+_FLAG_GLOBAL_TAGS: Final[str] = "--global-tags"
+_FLAG_LINK_TO_PREVIOUS: Final[str] = "--link-to-previous"
+_FLAG_LINK_TO_NEXT: Final[str] = "--link-to-next"
+_FLAG_SPLIT: Final[str] = "--split"
+_FLAG_LINK: Final[str] = "--link"
+
+# Packed nanosecond key of a Timestamp, lets ordering checks compare plain ints
+_TIMESTAMP_KEY = attrgetter("_key")
+
+
+def _as_timestamp(ts):
+    """Convert a timestamp given as a Timestamp, a str or a number of seconds to a Timestamp."""
+    if isinstance(ts, Timestamp):
+        return ts
+    if isinstance(ts, str):
+        return Timestamp.from_string(ts)
+    return Timestamp.from_seconds(ts)
+
 
 class MKVFile:
     """A class that represents an MKV file.
@@ -90,16 +116,21 @@ class MKVFile:
         self._global_tags_file = None
         self._link_to_previous_file = None
         self._link_to_next_file = None
+        self._link_to_previous_option = ()
+        self._link_to_next_option = ()
         self.tracks = []
         self.attachments = []
         if file_path is not None and not verify_mkvmerge(mkvmerge_path=self.mkvmerge_path):
             raise FileNotFoundError(
                 "mkvmerge is not at the specified path, add it there or change the mkvmerge_path property",
             )
+        if file_path is not None:
+            # expand once, everything below works on the expanded path
+            file_path = expanduser(file_path)
         if file_path is not None and verify_matroska(file_path):
             # add file title
-            file_path = expanduser(file_path)
-            info_json = json.loads(sp.check_output([self.mkvmerge_path, "-J", file_path]).decode())
+            # verify_matroska has just identified the file, so this is served from the identification cache
+            info_json = identify(file_path, mkvmerge_path=self.mkvmerge_path)
             if self.title is None and "title" in info_json["container"]["properties"]:
                 self.title = info_json["container"]["properties"]["title"]
 
@@ -117,7 +148,7 @@ class MKVFile:
                 self.add_track(new_track)
 
         # split options
-        self._split_options = []
+        self._split_options = ()
 
     def __repr__(self):
         return repr(self.__dict__)
@@ -157,88 +188,30 @@ class MKVFile:
         """
 
         output_path = expanduser(output_path)
-        command = [self.mkvmerge_path, "-o", output_path]
+        command = [self.mkvmerge_path, _FLAG_OUTPUT, output_path]
         if self.title is not None:
-            command.extend(["--title", self.title])
-        # add tracks
-        for track in self.tracks:
-            # flags
-            if track.track_name is not None:
-                command.extend(["--track-name", str(track.track_id) + ":" + track.track_name])
-            if track.language is not None:
-                command.extend(["--language", str(track.track_id) + ":" + track.language])
-            if track.tags is not None:
-                command.extend(["--tags", str(track.track_id) + ":" + track.tags])
-            if track.default_track:
-                command.extend(["--default-track", str(track.track_id) + ":1"])
-            else:
-                command.extend(["--default-track", str(track.track_id) + ":0"])
-            if track.forced_track:
-                command.extend(["--forced-track", str(track.track_id) + ":1"])
-            else:
-                command.extend(["--forced-track", str(track.track_id) + ":0"])
-
-            # remove extra tracks
-            if track.track_type != "video":
-                command.append("-D")
-            else:
-                command.extend(["-d", str(track.track_id)])
-            if track.track_type != "audio":
-                command.append("-A")
-            else:
-                command.extend(["-a", str(track.track_id)])
-            if track.track_type != "subtitles":
-                command.append("-S")
-            else:
-                command.extend(["-s", str(track.track_id)])
-
-            # exclusions
-            if track.no_chapters:
-                command.append("--no-chapters")
-            if track.no_global_tags:
-                command.append("--no-global-tags")
-            if track.no_track_tags:
-                command.append("--no-track-tags")
-            if track.no_attachments:
-                command.append("--no-attachments")
-
-            # add path
-            command.append(track.file_path)
-
-        # add attachments
-        for attachment in self.attachments:
-            # info
-            if attachment.name is not None:
-                command.extend(["--attachment-name", attachment.name])
-            if attachment.description is not None:
-                command.extend(["--attachment-description", attachment.description])
-            if attachment.mime_type is not None:
-                command.extend(["--attachment-mime-type", attachment.mime_type])
-
-            # add path
-            if not attachment.attach_once:
-                command.extend(["--attach-file", attachment.file_path])
-            else:
-                command.extend(["--attach-file-once", attachment.file_path])
+            command += (_FLAG_TITLE, self.title)
+
+        # add tracks and attachments
+        command.extend(chain.from_iterable(track.command() for track in self.tracks))
+        command.extend(chain.from_iterable(attachment.command() for attachment in self.attachments))
 
         # chapters
         if self._chapter_language is not None:
-            command.extend(["--chapter-language", self._chapter_language])
+            command += (_FLAG_CHAPTER_LANGUAGE, self._chapter_language)
         if self._chapters_file is not None:
-            command.extend(["--chapters", self._chapters_file])
+            command += (_FLAG_CHAPTERS, self._chapters_file)
 
         # global tags
         if self._global_tags_file is not None:
-            command.extend(["--global-tags", self._global_tags_file])
+            command += (_FLAG_GLOBAL_TAGS, self._global_tags_file)
 
-        # linking
-        if self._link_to_previous_file is not None:
-            command.extend(["--link-to-previous", "=" + self._link_to_previous_file])
-        if self._link_to_next_file is not None:
-            command.extend(["--link-to-next", "=" + self._link_to_next_file])
+        # linking, the arguments are built when the link is set
+        command += self._link_to_previous_option
+        command += self._link_to_next_option
 
         # split options
-        command.extend(self._split_options)
+        command += self._split_options
 
         if subprocess:
             return command
@@ -264,12 +237,13 @@ class MKVFile:
                 "mkvmerge is not at the specified path, add it there or change the mkvmerge_path property",
             )
         output_path = expanduser(output_path)
+        # generate the command once, the printed form is joined from the same list
+        command = self.command(output_path, subprocess=True)
         if silent:
-            sp.run(self.command(output_path, subprocess=True), stdout=open(devnull, "wb"), check=True)
+            sp.run(command, stdout=sp.DEVNULL, check=True)
         else:
-            command = self.command(output_path)
-            print('Running with command:\n"' + command + '"')
-            sp.run(self.command(output_path, subprocess=True), check=True, capture_output=True)
+            print('Running with command:\n"' + " ".join(command) + '"')
+            sp.run(command, check=True, capture_output=True)
 
     def add_file(self, file):
         """Add an MKV file into the :class:`~pymkv.MKVFile` object.
@@ -482,7 +456,7 @@ class MKVFile:
 
     def split_none(self):
         """Remove all splitting options."""
-        self._split_options = []
+        self._split_options = ()
 
     def split_size(self, size, link=False):
         """Split the output file into parts by size.
@@ -504,9 +478,9 @@ class MKVFile:
             size = size.bytes
         elif not isinstance(size, int):
             raise TypeError("size is not a bitmath object or integer")
-        self._split_options = ["--split", f"size:{size}"]
+        self._split_options = (_FLAG_SPLIT, f"size:{size}")
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_duration(self, duration: int, link=False):
         """Split the output file into parts by duration.
@@ -519,9 +493,13 @@ class MKVFile:
         link : bool, optional
             Determines if the split files should be linked together after splitting.
         """
-        self._split_options = ["--split", "duration:" + str(Timestamp.from_seconds(duration))]
+        if isinstance(duration, int):
+            # whole seconds need no Timestamp, format them directly
+            self._split_options = (_FLAG_SPLIT, "duration:" + format_seconds(duration))
+        else:
+            self._split_options = (_FLAG_SPLIT, "duration:" + str(Timestamp.from_seconds(duration)))
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_timestamps(self, timestamps: Iterable[Timestamp], link=False):
         """Split the output file into parts by timestamps.
@@ -546,17 +524,20 @@ class MKVFile:
             raise ValueError(f'"{timestamps}" are not properly formatted timestamps')
         if None in ts_flat:
             raise ValueError(f'"{timestamps}" are not properly formatted timestamps')
-        for ts_1, ts_2 in zip(ts_flat[:-1], ts_flat[1:]):
-            if ts_1 >= ts_2:
-                raise ValueError(f'"{timestamps}" are not properly formatted timestamps')
+        # strs and ints are converted once, so they are ordered and formatted the same way as Timestamps
+        try:
+            ts_flat = list(map(_as_timestamp, ts_flat))
+        except (TypeError, ValueError):
+            raise ValueError(f'"{timestamps}" are not properly formatted timestamps') from None
+        ts_keys = list(map(_TIMESTAMP_KEY, ts_flat))
+        if any(key_1 >= key_2 for key_1, key_2 in zip(ts_keys, ts_keys[1:])):
+            raise ValueError(f'"{timestamps}" are not properly formatted timestamps')
 
         # build ts_string from timestamps
-        ts_string = "timestamps:"
-        for ts in ts_flat:
-            ts_string += str(ts) + ","
-        self._split_options = ["--split", ts_string[:-1]]
+        ts_string = "timestamps:" + ",".join(map(str, ts_flat))
+        self._split_options = (_FLAG_SPLIT, ts_string)
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_frames(self, *frames, link=False):
         """Split the output file into parts by frames.
@@ -580,20 +561,17 @@ class MKVFile:
         f_flat = MKVFile.flatten(frames)
         if len(f_flat) == 0:
             raise ValueError(f'"{frames}" are not properly formatted frames')
-        for f in f_flat:
-            if not isinstance(f, int):
-                raise TypeError(f'frame "{f}" not an int')
-        for f_1, f_2 in zip(f_flat[:-1], f_flat[1:]):
-            if f_1 >= f_2:
-                raise ValueError(f'"{frames}" are not properly formatted frames')
+        if not all(isinstance(f, int) for f in f_flat):
+            f = next(f for f in f_flat if not isinstance(f, int))
+            raise TypeError(f'frame "{f}" not an int')
+        if any(f_1 >= f_2 for f_1, f_2 in zip(f_flat, f_flat[1:])):
+            raise ValueError(f'"{frames}" are not properly formatted frames')
 
         # build f_string from frames
-        f_string = "frames:"
-        for f in f_flat:
-            f_string += str(f) + ","
-        self._split_options = ["--split", f_string[:-1]]
+        f_string = "frames:" + ",".join(map(str, f_flat))
+        self._split_options = (_FLAG_SPLIT, f_string)
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_timestamp_parts(self, timestamp_parts, link=False):
         """Split the output in parts by time parts.
@@ -614,21 +592,19 @@ class MKVFile:
         ValueError
             Raised if `timestamp_parts` contains improperly formatted parts.
         """
-        # check if in parts form
-        ts_flat = MKVFile.flatten(timestamp_parts)
         if len(timestamp_parts) == 0:
             raise ValueError(f'"{timestamp_parts}" are not properly formatted parts')
-        if None in ts_flat[1:-1]:
-            raise ValueError(f'"{timestamp_parts}" are not properly formatted parts')
-        for ts_1, ts_2 in zip(ts_flat[:-1], ts_flat[1:]):
-            if None not in (ts_1, ts_2) and Timestamp(ts_1) >= Timestamp(ts_2):
-                raise ValueError(f'"{timestamp_parts}" are not properly formatted parts')
 
-        # build ts_string from parts
-        ts_string = "parts:"
+        # validate and build the parts in a single pass over the timestamps
+        flatten = MKVFile.flatten
+        segments = []
+        add_segments = segments.extend
+        previous = None
+        at_start = True
+        after_end = False
         for ts_set in timestamp_parts:
             # flatten set
-            ts_set = MKVFile.flatten(ts_set)
+            ts_set = flatten(ts_set)
 
             # check if in set form
             if not isinstance(ts_set, (list, tuple)):
@@ -636,19 +612,31 @@ class MKVFile:
             if len(ts_set) < 2 or len(ts_set) % 2 != 0:
                 raise ValueError(f'"{ts_set}" is not a properly formatted set')
 
-            # build parts from sets
-            for index, ts in enumerate(ts_set):
-                # check for combined split
-                if index % 2 == 0 and index > 0:
-                    ts_string += "+"
-                # add timestamp if not None
-                if ts is not None:
-                    ts_string += str(Timestamp(ts))
-                # add ',' or '-'
-                ts_string += "-" if index % 2 == 0 else ","
-        self._split_options = ["--split", ts_string[:-1]]
+            ts_strings = []
+            add_string = ts_strings.append
+            for ts in ts_set:
+                # only the very first and last timestamps may be None
+                if after_end:
+                    raise ValueError(f'"{timestamp_parts}" are not properly formatted parts')
+                if ts is None:
+                    after_end = not at_start
+                    add_string("")
+                else:
+                    timestamp = Timestamp(ts)
+                    if previous is not None and previous >= timestamp:
+                        raise ValueError(f'"{timestamp_parts}" are not properly formatted parts')
+                    previous = timestamp
+                    add_string(str(timestamp))
+                at_start = False
+
+            # build parts from sets, with '+' combining pairs into a single file
+            add_segments(
+                f"{'+' if index else ''}{ts_strings[index]}-{ts_strings[index + 1]}"
+                for index in range(0, len(ts_strings), 2)
+            )
+        self._split_options = (_FLAG_SPLIT, "parts:" + ",".join(segments))
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_parts_frames(self, frame_parts, link=False):
         """Split the output in parts by frames.
@@ -670,21 +658,19 @@ class MKVFile:
         ValueError
             Raised if `frame_parts` contains improperly formatted parts.
         """
-        # check if in parts form
-        f_flat = MKVFile.flatten(frame_parts)
         if len(frame_parts) == 0:
             raise ValueError(f'"{frame_parts}" are not properly formatted parts')
-        if None in f_flat[1:-1]:
-            raise ValueError(f'"{frame_parts}" are not properly formatted parts')
-        for f_1, f_2 in zip(f_flat[:-1], f_flat[1:]):
-            if None not in (f_1, f_2) and f_1 >= f_2:
-                raise ValueError(f'"{frame_parts}" are not properly formatted parts')
 
-        # build f_string from parts
-        f_string = "parts:"
+        # validate and build the parts in a single pass over the frames
+        flatten = MKVFile.flatten
+        segments = []
+        add_segments = segments.extend
+        previous = None
+        at_start = True
+        after_end = False
         for f_set in frame_parts:
             # flatten set
-            f_set = MKVFile.flatten(f_set)
+            f_set = flatten(f_set)
 
             # check if in set form
             if not isinstance(f_set, (list, tuple)):
@@ -692,23 +678,33 @@ class MKVFile:
             if len(f_set) < 2 or len(f_set) % 2 != 0:
                 raise ValueError(f'"{f_set}" is not a properly formatted set')
 
-            # build parts from sets
-            for index, f in enumerate(f_set):
+            f_strings = []
+            add_string = f_strings.append
+            for f in f_set:
                 # check if frames are ints
                 if not isinstance(f, int) and f is not None:
                     raise TypeError(f'frame "{f}" not an int')
-
-                # check for combined split
-                if index % 2 == 0 and index > 0:
-                    f_string += "+"
-                # add frame if not None
-                if f is not None:
-                    f_string += str(f)
-                # add ',' or '-'
-                f_string += "-" if index % 2 == 0 else ","
-        self._split_options = ["--split", f_string[:-1]]
+                # only the very first and last frames may be None
+                if after_end:
+                    raise ValueError(f'"{frame_parts}" are not properly formatted parts')
+                if f is None:
+                    after_end = not at_start
+                    add_string("")
+                else:
+                    if previous is not None and previous >= f:
+                        raise ValueError(f'"{frame_parts}" are not properly formatted parts')
+                    previous = f
+                    add_string(str(f))
+                at_start = False
+
+            # build parts from sets, with '+' combining pairs into a single file
+            add_segments(
+                f"{'+' if index else ''}{f_strings[index]}-{f_strings[index + 1]}"
+                for index in range(0, len(f_strings), 2)
+            )
+        self._split_options = (_FLAG_SPLIT, "parts:" + ",".join(segments))
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def split_chapters(self, *chapters, link=False):
         """Split the output file into parts by chapters.
@@ -731,24 +727,22 @@ class MKVFile:
         # check if in chapters form
         c_flat = MKVFile.flatten(chapters)
         if len(chapters) == 0:
-            self._split_options = ["--split", "chapters:all"]
+            self._split_options = (_FLAG_SPLIT, "chapters:all")
             return
-        for c in c_flat:
+        if not all(isinstance(c, int) and c > 0 for c in c_flat):
+            # report the first invalid chapter the way the per chapter checks did
+            c = next(c for c in c_flat if not isinstance(c, int) or c < 1)
             if not isinstance(c, int):
                 raise TypeError(f'chapter "{c}" not an int')
-            if c < 1:
-                raise ValueError(f'"{chapters}" are not properly formatted chapters')
-        for c_1, c_2 in zip(c_flat[:-1], c_flat[1:]):
-            if c_1 >= c_2:
-                raise ValueError(f'"{chapters}" are not properly formatted chapters')
+            raise ValueError(f'"{chapters}" are not properly formatted chapters')
+        if any(c_1 >= c_2 for c_1, c_2 in zip(c_flat, c_flat[1:])):
+            raise ValueError(f'"{chapters}" are not properly formatted chapters')
 
         # build c_string from chapters
-        c_string = "chapters:"
-        for c in c_flat:
-            c_string += str(c) + ","
-        self._split_options = ["--split", c_string[:-1]]
+        c_string = "chapters:" + ",".join(map(str, c_flat))
+        self._split_options = (_FLAG_SPLIT, c_string)
         if link:
-            self._split_options += "--link"
+            self._split_options += (_FLAG_LINK,)
 
     def link_to_previous(self, file_path):
         """Link the output file as the predecessor of the `file_path` file.
@@ -766,12 +760,13 @@ class MKVFile:
             Raised if file at `file_path` cannot be verified as an MKV.
         """
         # check if valid file
-        if not isinstance(str, file_path):
+        if not isinstance(file_path, str):
             raise TypeError(f'"{file_path}" is not of type str')
         file_path = expanduser(file_path)
         if not verify_matroska(file_path):
             raise ValueError(f'"{file_path}" is not a matroska file')
         self._link_to_previous_file = file_path
+        self._link_to_previous_option = (_FLAG_LINK_TO_PREVIOUS, "=" + file_path)
 
     def link_to_next(self, file_path):
         """Link the output file as the successor of the `file_path` file.
@@ -795,11 +790,14 @@ class MKVFile:
         if not verify_matroska(file_path):
             raise ValueError(f'"{file_path}" is not a matroska file')
         self._link_to_next_file = file_path
+        self._link_to_next_option = (_FLAG_LINK_TO_NEXT, "=" + file_path)
 
     def link_to_none(self):
         """Remove all linking to previous and next options."""
         self._link_to_previous_file = None
         self._link_to_next_file = None
+        self._link_to_previous_option = ()
+        self._link_to_next_option = ()
 
     def chapters(self, file_path, language=None):
         """Add a chapters file to the :class:`~pymkv.MKVFile` object.
@@ -883,23 +881,53 @@ class MKVFile:
 
     def no_chapters(self):
         """Ignore the existing chapters of the :class:`~pymkv.MKVFile` object."""
-        for track in self.tracks:
-            track.no_chapters = True
+        self._set_on_tracks(no_chapters=True)
 
     def no_global_tags(self):
         """Ignore the existing global tags of the :class:`~pymkv.MKVFile` object."""
-        for track in self.tracks:
-            track.no_global_tags = True
+        self._set_on_tracks(no_global_tags=True)
 
     def no_track_tags(self):
         """Ignore the existing track tags of the :class:`~pymkv.MKVFile` object."""
-        for track in self.tracks:
-            track.no_track_tags = True
+        self._set_on_tracks(no_track_tags=True)
 
     def no_attachments(self):
         """Ignore the existing attachments of the :class:`~pymkv.MKVFile` object."""
+        self._set_on_tracks(no_attachments=True)
+
+    def strip_metadata(self, *, chapters=True, global_tags=True, track_tags=True, attachments=True):
+        """Ignore several kinds of existing metadata of the :class:`~pymkv.MKVFile` object at once.
+
+        Equivalent to calling :meth:`~pymkv.MKVFile.no_chapters`, :meth:`~pymkv.MKVFile.no_global_tags`,
+        :meth:`~pymkv.MKVFile.no_track_tags` and :meth:`~pymkv.MKVFile.no_attachments`, but only walks the tracks
+        once.
+
+        Parameters
+        ----------
+        chapters : bool, optional
+            Ignore the existing chapters. Default is True.
+        global_tags : bool, optional
+            Ignore the existing global tags. Default is True.
+        track_tags : bool, optional
+            Ignore the existing track tags. Default is True.
+        attachments : bool, optional
+            Ignore the existing attachments. Default is True.
+        """
+        flags = {
+            "no_chapters": chapters,
+            "no_global_tags": global_tags,
+            "no_track_tags": track_tags,
+            "no_attachments": attachments,
+        }
+        self._set_on_tracks(**{flag: True for flag, enabled in flags.items() if enabled})
+
+    def _set_on_tracks(self, **flags):
+        """Set the given attributes on every track in a single pass."""
+        if not flags:
+            return
         for track in self.tracks:
-            track.no_attachments = True
+            for name, value in flags.items():
+                setattr(track, name, value)
 
     @staticmethod
     def flatten(item):
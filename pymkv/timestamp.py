@@ -0,0 +1,283 @@
+from functools import lru_cache
+from typing import Final
+
+# Time conversion constants
+SECONDS_PER_HOUR: Final[int] = 3600
+SECONDS_PER_MINUTE: Final[int] = 60
+MINUTES_PER_HOUR: Final[int] = 60
+NANOSECONDS_PER_SECOND: Final[int] = 1_000_000_000
+NANOSECOND_PRECISION: Final[int] = 9
+
+# Timestamp string grammar: [H]H:[M]M:[S]S[.n{1,9}] or [M]M:[S]S[.n{1,9}]
+MAX_FIELD_DIGITS: Final[int] = 2
+MIN_FIELDS: Final[int] = 2
+MAX_FIELDS: Final[int] = 3
+
+# ASCII values used by the from_string scanner
+_DIGIT_ZERO: Final[int] = ord("0")
+_DIGIT_NINE: Final[int] = ord("9")
+_FIELD_SEPARATOR: Final[int] = ord(":")
+_FRACTION_SEPARATOR: Final[int] = ord(".")
+
+# Canonical HH:MM:SS[.n{1,9}] layout mkvmerge writes, parsed by position without scanning
+_CANONICAL_LENGTH: Final[int] = 8
+_CANONICAL_MAX_LENGTH: Final[int] = _CANONICAL_LENGTH + 1 + NANOSECOND_PRECISION
+
+# Scale factors to pad a fraction of n digits out to nanoseconds, indexed by the number of missing digits
+_POW10: Final[tuple[int, ...]] = tuple(10**exponent for exponent in range(NANOSECOND_PRECISION + 1))
+
+
+def format_seconds(seconds: int) -> str:
+    """Format a whole number of seconds as HH:MM:SS without building a Timestamp.
+
+    Args:
+        seconds: Time in whole seconds
+
+    Returns:
+        The formatted string, as produced by str() of the equivalent Timestamp
+    """
+    hours, remainder = divmod(seconds, SECONDS_PER_HOUR)
+    minutes, seconds = divmod(remainder, SECONDS_PER_MINUTE)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class Timestamp:
+    """Represents a timestamp for mkvmerge in format HH:MM:SS.nnnnnnnnn"""
+
+    __slots__ = ("_fields", "_key", "_nanoseconds", "_str", "_total_seconds")
+
+    def __init__(self, total_seconds: int, nanoseconds: int = 0) -> None:
+        """Create a timestamp from canonical values.
+
+        Args:
+            total_seconds: Total seconds (integer part)
+            nanoseconds: Nanosecond part (0-999999999)
+        """
+        if nanoseconds < 0 or nanoseconds >= NANOSECONDS_PER_SECOND:
+            raise ValueError(f"Nanoseconds must be 0-{NANOSECONDS_PER_SECOND - 1}, got {nanoseconds}")
+
+        self._total_seconds: int = int(total_seconds)
+        self._nanoseconds: int = int(nanoseconds)
+        # Single integer of total nanoseconds, used for comparisons and hashing
+        self._key: int = self._total_seconds * NANOSECONDS_PER_SECOND + self._nanoseconds
+        # Formatted form, computed on first use since the timestamp never changes
+        self._str: str | None = None
+        # (hours, minutes, seconds, nanoseconds), computed on first index for the same reason
+        self._fields: tuple[int, int, int, int] | None = None
+
+    @staticmethod
+    def from_string(timestamp_str: str) -> "Timestamp":
+        """Create a timestamp from a string like 'HH:MM:SS.nnnnnnnnn'.
+
+        Args:
+            timestamp_str: String in format HH:MM:SS.nnn, MM:SS.nnn, etc.
+
+        Returns:
+            New Timestamp object
+        """
+        try:
+            data = timestamp_str.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"Invalid timestamp format: {timestamp_str}") from None
+
+        # Fast path for the canonical layout, fixed positions avoid the per-byte loop below
+        length = len(data)
+        if (
+            (
+                length == _CANONICAL_LENGTH
+                or (
+                    _CANONICAL_LENGTH + 1 < length <= _CANONICAL_MAX_LENGTH
+                    and data[_CANONICAL_LENGTH] == _FRACTION_SEPARATOR
+                    and data[_CANONICAL_LENGTH + 1 :].isdigit()
+                )
+            )
+            and data[2] == data[5] == _FIELD_SEPARATOR
+            and data[0:2].isdigit()
+            and data[3:5].isdigit()
+            and data[6:8].isdigit()
+        ):
+            total_seconds = int(data[0:2]) * SECONDS_PER_HOUR + int(data[3:5]) * SECONDS_PER_MINUTE + int(data[6:8])
+            if length == _CANONICAL_LENGTH:
+                return Timestamp(total_seconds)
+            return Timestamp(total_seconds, int(data[_CANONICAL_LENGTH + 1 :]) * _POW10[_CANONICAL_MAX_LENGTH - length])
+
+        # Bind the per-byte constants locally, the loop below looks them up for every character
+        zero = _DIGIT_ZERO
+        nine = _DIGIT_NINE
+        fraction_separator = _FRACTION_SEPARATOR
+        separators = (_FIELD_SEPARATOR, fraction_separator)
+        max_field_digits = MAX_FIELD_DIGITS
+
+        # Single pass over the string, accumulating each field directly into an integer
+        fields: list[int] = []
+        current = 0
+        digits = 0
+        in_fraction = False
+        for byte in data:
+            if zero <= byte <= nine:
+                current = current * 10 + (byte - zero)
+                digits += 1
+            elif byte in separators and not in_fraction:
+                if not 0 < digits <= max_field_digits or len(fields) == MAX_FIELDS:
+                    raise ValueError(f"Invalid timestamp format: {timestamp_str}")
+                fields.append(current)
+                current = 0
+                digits = 0
+                in_fraction = byte == fraction_separator
+            else:
+                raise ValueError(f"Invalid timestamp format: {timestamp_str}")
+
+        if in_fraction:
+            if not 0 < digits <= NANOSECOND_PRECISION:
+                raise ValueError(f"Invalid timestamp format: {timestamp_str}")
+            # Pad nanoseconds to 9 digits
+            nanoseconds = current * _POW10[NANOSECOND_PRECISION - digits]
+        else:
+            if not 0 < digits <= MAX_FIELD_DIGITS:
+                raise ValueError(f"Invalid timestamp format: {timestamp_str}")
+            fields.append(current)
+            nanoseconds = 0
+
+        if not MIN_FIELDS <= len(fields) <= MAX_FIELDS:
+            raise ValueError(f"Invalid timestamp format: {timestamp_str}")
+
+        # MM:SS or HH:MM:SS
+        if len(fields) == MIN_FIELDS:
+            hh = 0
+            mm, ss = fields
+        else:
+            hh, mm, ss = fields
+
+        total_seconds = hh * SECONDS_PER_HOUR + mm * SECONDS_PER_MINUTE + ss
+        return Timestamp(total_seconds, nanoseconds)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def from_seconds(seconds: int | float) -> "Timestamp":
+        """Create a timestamp from seconds (int or float).
+
+        Timestamps are immutable, so the result is cached and shared between calls with the same seconds.
+
+        Args:
+            seconds: Time in seconds
+
+        Returns:
+            Timestamp object
+        """
+        if isinstance(seconds, float) and not seconds.is_integer():
+            total_seconds = int(seconds)
+            nanoseconds = int((seconds - total_seconds) * NANOSECONDS_PER_SECOND)
+        else:
+            total_seconds = int(seconds)
+            nanoseconds = 0
+
+        return Timestamp(total_seconds, nanoseconds)
+
+    @staticmethod
+    def from_timestamp(other: "Timestamp") -> "Timestamp":
+        """Create a timestamp from another Timestamp (copy constructor).
+
+        Args:
+            other: Another Timestamp object
+
+        Returns:
+            New Timestamp object (copy)
+        """
+        return Timestamp(other._total_seconds, other._nanoseconds)  # noqa: SLF001
+
+    @staticmethod
+    def from_components(hours: int, minutes: int, seconds: int, nanoseconds: int = 0) -> "Timestamp":
+        """Create a timestamp from individual time components.
+
+        Args:
+            hours: Hours (0+)
+            minutes: Minutes (0-59)
+            seconds: Seconds (0-59)
+            nanoseconds: Nanoseconds (0-999999999)
+
+        Returns:
+            New Timestamp object
+        """
+        if minutes < 0 or minutes >= MINUTES_PER_HOUR:
+            raise ValueError(f"Minutes must be 0-59, got {minutes}")
+        if seconds < 0 or seconds >= SECONDS_PER_MINUTE:
+            raise ValueError(f"Seconds must be 0-59, got {seconds}")
+
+        total_seconds = hours * SECONDS_PER_HOUR + minutes * SECONDS_PER_MINUTE + seconds
+        return Timestamp(total_seconds, nanoseconds)
+
+    def __str__(self) -> str:
+        """Format as HH:MM:SS.nnnnnnnnn (strip trailing zeros from nanoseconds)."""
+        if self._str is not None:
+            return self._str
+
+        hours, remainder = divmod(self._total_seconds, SECONDS_PER_HOUR)
+        minutes, seconds = divmod(remainder, SECONDS_PER_MINUTE)
+
+        nanoseconds = self._nanoseconds
+        if nanoseconds == 0:
+            self._str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+            return self._str
+
+        # Strip trailing zeros from the nanoseconds arithmetically, keeping the leading ones
+        width = NANOSECOND_PRECISION
+        while nanoseconds % 10 == 0:
+            nanoseconds //= 10
+            width -= 1
+
+        self._str = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{nanoseconds:0{width}d}"
+        return self._str
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other: "Timestamp") -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self._key < other._key
+
+    def __le__(self, other: "Timestamp") -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self._key <= other._key
+
+    def __gt__(self, other: "Timestamp") -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self._key > other._key
+
+    def __ge__(self, other: "Timestamp") -> bool:
+        if not isinstance(other, Timestamp):
+            return NotImplemented
+        return self._key >= other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __getitem__(self, index: int) -> int:
+        """Get (hours, minutes, seconds, nanoseconds) by index."""
+        fields = self._fields
+        if fields is None:
+            hours, remainder = divmod(self._total_seconds, SECONDS_PER_HOUR)
+            minutes, seconds = divmod(remainder, SECONDS_PER_MINUTE)
+            fields = self._fields = (hours, minutes, seconds, self._nanoseconds)
+        # Indexing the tuple handles negative indices and raises IndexError past the nanoseconds
+        return fields[index]
+
+    @property
+    def hh(self) -> int:
+        return self._total_seconds // SECONDS_PER_HOUR
+
+    @property
+    def mm(self) -> int:
+        return (self._total_seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE
+
+    @property
+    def ss(self) -> int:
+        return self._total_seconds % SECONDS_PER_MINUTE
+
+    @property
+    def nn(self) -> int:
+        return self._nanoseconds
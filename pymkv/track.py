@@ -35,14 +35,32 @@ Now all these tracks can be added to an :class:`~pymkv.MKVFile` object and muxed
 >>> file.mux('path/to/output.mkv')
 """
 
-import json
-import subprocess as sp
 from os.path import expanduser
 from os.path import isfile
+from typing import Final
 
+from pymkv.utils import identify
 from pymkv.utils import is_iso_639_2_language_code
 from pymkv.verifications import verify_supported
 
+# mkvmerge options used by command()
+_FLAG_TRACK_NAME: Final[str] = "--track-name"
+_FLAG_LANGUAGE: Final[str] = "--language"
+_FLAG_TAGS: Final[str] = "--tags"
+_FLAG_DEFAULT_TRACK: Final[str] = "--default-track"
+_FLAG_FORCED_TRACK: Final[str] = "--forced-track"
+_FLAG_NO_CHAPTERS: Final[str] = "--no-chapters"
+_FLAG_NO_GLOBAL_TAGS: Final[str] = "--no-global-tags"
+_FLAG_NO_TRACK_TAGS: Final[str] = "--no-track-tags"
+_FLAG_NO_ATTACHMENTS: Final[str] = "--no-attachments"
+
+# (track type, flag to exclude tracks of that type, flag to keep only the given track ids of that type)
+_TRACK_TYPE_CONFIG: Final[tuple[tuple[str, str, str], ...]] = (
+    ("video", "-D", "-d"),
+    ("audio", "-A", "-a"),
+    ("subtitles", "-S", "-s"),
+)
+
 
 class MKVTrack:
     """A class that represents a track for an :class:`~pymkv.MKVFile` object.
@@ -99,10 +117,39 @@ class MKVTrack:
         that are already part of an MKV file.
     """
 
+    __slots__ = (
+        "_file_path",
+        "_id_str",
+        "_info_json",
+        "_language",
+        "_tags",
+        "_track_codec",
+        "_track_id",
+        "_track_type",
+        "_type_flags",
+        "default_track",
+        "forced_track",
+        "mkvmerge_path",
+        "no_attachments",
+        "no_chapters",
+        "no_global_tags",
+        "no_track_tags",
+        "track_name",
+    )
+
+    # caches derived from the identification, kept out of repr()
+    _cache_slots = frozenset(("_id_str", "_info_json", "_type_flags"))
+
+    # checks language codes, a class attribute so a subclass or test can swap it out
+    _language_validator = staticmethod(is_iso_639_2_language_code)
+
     def __init__(self, file_path, track_id=0, track_name=None, language=None, default_track=False, forced_track=False):
         # track info
         self._track_codec = None
         self._track_type = None
+        self._info_json = None
+        self._id_str = None
+        self._type_flags = ()
 
         # base
         self.mkvmerge_path = "mkvmerge"
@@ -126,7 +173,37 @@ class MKVTrack:
         self.no_attachments = False
 
     def __repr__(self):
-        return repr(self.__dict__)
+        return repr({name: getattr(self, name) for name in self.__slots__ if name not in self._cache_slots})
+
+    def command(self):
+        """Generates the mkvmerge arguments that include this track when muxing an :class:`~pymkv.MKVFile`.
+
+        Returns
+        -------
+        list of str
+            The track options followed by the path of the track file.
+        """
+        id_str = self._id_str
+        # built as a single list display, optional options are splatted in as empty or two item tuples
+        return [
+            # flags
+            *((_FLAG_TRACK_NAME, f"{id_str}:{self.track_name}") if self.track_name is not None else ()),
+            *((_FLAG_LANGUAGE, f"{id_str}:{self.language}") if self.language is not None else ()),
+            *((_FLAG_TAGS, f"{id_str}:{self.tags}") if self.tags is not None else ()),
+            _FLAG_DEFAULT_TRACK,
+            f"{id_str}:{1 if self.default_track else 0}",
+            _FLAG_FORCED_TRACK,
+            f"{id_str}:{1 if self.forced_track else 0}",
+            # remove extra tracks, worked out when the track_id was set
+            *self._type_flags,
+            # exclusions
+            *((_FLAG_NO_CHAPTERS,) if self.no_chapters else ()),
+            *((_FLAG_NO_GLOBAL_TAGS,) if self.no_global_tags else ()),
+            *((_FLAG_NO_TRACK_TAGS,) if self.no_track_tags else ()),
+            *((_FLAG_NO_ATTACHMENTS,) if self.no_attachments else ()),
+            # add path
+            self.file_path,
+        ]
 
     @property
     def file_path(self):
@@ -146,8 +223,10 @@ class MKVTrack:
     def file_path(self, file_path):
         file_path = expanduser(file_path)
         if not verify_supported(file_path):
-            raise ValueError('"{}" is not a supported file')
+            raise ValueError(f'"{file_path}" is not a supported file')
         self._file_path = file_path
+        # identify once per file, selecting a different track_id reuses the result
+        self._info_json = identify(file_path, mkvmerge_path=self.mkvmerge_path)
         self.track_id = 0
 
     @property
@@ -166,13 +245,20 @@ class MKVTrack:
 
     @track_id.setter
     def track_id(self, track_id):
-        info_json = json.loads(sp.check_output([self.mkvmerge_path, "-J", self.file_path]).decode())
+        info_json = self._info_json
         if not 0 <= track_id < len(info_json["tracks"]):
             raise IndexError("track index out of range")
         self._track_id = track_id
         self._track_codec = info_json["tracks"][track_id]["codec"]
         self._track_type = info_json["tracks"][track_id]["type"]
 
+        # the command arguments that only depend on the track, built once here rather than on every command()
+        self._id_str = str(track_id)
+        type_flags = []
+        for track_type, exclude_flag, include_flag in _TRACK_TYPE_CONFIG:
+            type_flags += (include_flag, self._id_str) if self._track_type == track_type else (exclude_flag,)
+        self._type_flags = tuple(type_flags)
+
     @property
     def language(self):
         """str: The language of the track.
@@ -189,7 +275,7 @@ class MKVTrack:
 
     @language.setter
     def language(self, language):
-        if language is None or language.lower() == "und" or is_iso_639_2_language_code(language):
+        if language is None or language.lower() == "und" or self._language_validator(language):
             self._language = language
         else:
             raise ValueError("not an ISO639-2 language code")
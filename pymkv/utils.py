@@ -1,10 +1,105 @@
 # sheldon woodward
 # 3/18/18
 
-"""ISO639-2 Three Character Language Codes"""
+"""Helpers shared by the pymkv classes: ISO639-2 language codes and mkvmerge identification."""
 
-from iso639 import is_language
+import os
+import subprocess as sp
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from functools import partial
+from pathlib import Path
 
+from pymkv import _identcache
 
+try:
+    # orjson is an optional, faster drop-in for parsing mkvmerge's identification output
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+__all__ = [
+    "batch_identify",
+    "clear_identify_cache",
+    "identify",
+    "is_iso_639_2_language_code",
+    "json_loads",
+]
+
+
+@lru_cache(maxsize=1024)
 def is_iso_639_2_language_code(language: str) -> bool:
+    # ISO639-2 codes are always three letters, anything else can be rejected without a database lookup
+    if len(language) != 3:  # noqa: PLR2004
+        return False
+    # iso639 loads its whole language database on import, so defer it until a language is actually checked
+    from iso639 import is_language  # noqa: PLC0415
+
     return is_language(language, "pt2t")
+
+
+@lru_cache(maxsize=512)
+def _identify_cached(file_path, mkvmerge_path, mtime_ns, size):
+    # The modification time and size only take part in the cache keys, so a rewritten file is identified again
+    if not _identcache.enabled():
+        return sp.check_output([mkvmerge_path, "-J", file_path])
+    cache_key = _identcache.key(file_path, mkvmerge_path, mtime_ns, size)
+    output = _identcache.get(cache_key)
+    if output is None:
+        output = sp.check_output([mkvmerge_path, "-J", file_path])
+        _identcache.put(cache_key, output)
+    return output
+
+
+def identify(file_path, mkvmerge_path="mkvmerge"):
+    """Identify a file with mkvmerge.
+
+    The output is cached on the file's absolute path, modification time and size, so identifying an unchanged file
+    again does not run mkvmerge. Clear the cache with :func:`clear_identify_cache`. Setting the ``PYMKV_CACHE``
+    environment variable to ``1`` also keeps the output in a cache on disk that is shared between runs.
+
+    file_path (str):
+        Path of the file to be identified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+
+    Returns the parsed JSON identification output of `mkvmerge -J`.
+    """
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        # let mkvmerge report on files that cannot be looked at
+        return json_loads(sp.check_output([mkvmerge_path, "-J", file_path]))
+    return _identify_stat(file_path, stat, mkvmerge_path)
+
+
+def clear_identify_cache():
+    """Clear the in memory cache of :func:`identify`, the on disk cache is left untouched."""
+    _identify_cached.cache_clear()
+
+
+def _identify_stat(file_path, stat, mkvmerge_path):
+    # identify a file the caller has already stat'ed, sharing the cache of identify() without a second stat
+    # unlike Path.absolute(), abspath also collapses '..', so every spelling of a path shares one cache entry
+    file_path = os.path.abspath(file_path)  # noqa: PTH100
+    return json_loads(_identify_cached(file_path, mkvmerge_path, stat.st_mtime_ns, stat.st_size))
+
+
+def batch_identify(file_paths, mkvmerge_path="mkvmerge", max_workers=None):
+    """Identify several files with mkvmerge concurrently.
+
+    Each file is identified by its own mkvmerge process, run from a pool of threads so process startup and disk
+    access overlap between files. Results are cached exactly as with :func:`identify`.
+
+    file_paths (iterable of str):
+        Paths of the files to be identified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    max_workers (int):
+        Maximum number of mkvmerge processes to run at once, defaults to the ThreadPoolExecutor default.
+
+    Returns a list of the parsed identification outputs, in the order of `file_paths`. If mkvmerge fails on any of
+    the files, the error for the earliest such file in `file_paths` is raised.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(identify, mkvmerge_path=mkvmerge_path), file_paths))
@@ -0,0 +1,143 @@
+# sheldon woodward
+# 3/24/18
+
+"""Verification functions for mkvmerge and associated files."""
+
+import asyncio
+import os
+import stat
+import subprocess as sp
+from functools import lru_cache
+from os.path import expanduser
+from pathlib import Path
+
+from pymkv.utils import _identify_stat
+
+
+@lru_cache(maxsize=8)
+def _mkvmerge_version(mkvmerge_path):
+    # failures raise and so are not cached, a missing mkvmerge is looked for again on the next check
+    return sp.check_output([mkvmerge_path, "-V"])
+
+
+def verify_mkvmerge(mkvmerge_path="mkvmerge"):
+    """Verify mkvmerge is working.
+
+    The version output of each mkvmerge path is cached once it has been run successfully. Clear the cache with
+    :func:`clear_mkvmerge_cache`.
+
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    try:
+        output = _mkvmerge_version(mkvmerge_path)
+    except (sp.CalledProcessError, FileNotFoundError):
+        return False
+    # compare the raw bytes, the version banner never needs decoding
+    return output.startswith(b"mkvmerge")
+
+
+def clear_mkvmerge_cache():
+    """Clear the cached version output of :func:`verify_mkvmerge`."""
+    _mkvmerge_version.cache_clear()
+
+
+def _identify_container(file_path, mkvmerge_path):
+    """Run the checks shared by the verify_* functions and return the container section of the file's
+    identification.
+
+    The identification is cached, so checking several properties of the same file only runs mkvmerge once.
+    """
+    if not verify_mkvmerge(mkvmerge_path=mkvmerge_path):
+        raise FileNotFoundError(
+            "mkvmerge is not at the specified path, add it there or change the mkvmerge_path property",
+        )
+    if isinstance(file_path, os.PathLike):
+        file_path = str(file_path)
+    elif not isinstance(file_path, str):
+        raise TypeError(f'"{file_path}" is not of type str')
+    file_path = expanduser(file_path)
+    # a single stat both checks for a regular file and keys the identification cache
+    try:
+        file_stat = Path(file_path).stat()
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        raise FileNotFoundError(f'"{file_path}" does not exist')
+    try:
+        return _identify_stat(file_path, file_stat, mkvmerge_path)["container"]
+    except sp.CalledProcessError:
+        raise ValueError(f'"{file_path}" could not be opened')
+
+
+def verify_matroska(file_path, mkvmerge_path="mkvmerge"):
+    """Verify if a file is a Matroska file.
+
+    file_path (str):
+        Path of the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return _identify_container(file_path, mkvmerge_path)["type"] == "Matroska"
+
+
+def verify_recognized(file_path, mkvmerge_path="mkvmerge"):
+    """Verify a file is recognized by mkvmerge.
+
+    file_path (str):
+        Path to the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return _identify_container(file_path, mkvmerge_path)["recognized"]
+
+
+def verify_supported(file_path, mkvmerge_path="mkvmerge"):
+    """Verify a file is supported by mkvmerge.
+
+    file_path (str):
+        Path to the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return _identify_container(file_path, mkvmerge_path)["supported"]
+
+
+async def verify_matroska_async(file_path, mkvmerge_path="mkvmerge"):
+    """Verify if a file is a Matroska file, without blocking the event loop.
+
+    Runs :func:`verify_matroska` in a worker thread, so several files can be verified concurrently with
+    ``asyncio.gather``. Results and errors are the same as the blocking function's.
+
+    file_path (str):
+        Path of the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return await asyncio.to_thread(verify_matroska, file_path, mkvmerge_path)
+
+
+async def verify_recognized_async(file_path, mkvmerge_path="mkvmerge"):
+    """Verify a file is recognized by mkvmerge, without blocking the event loop.
+
+    Runs :func:`verify_recognized` in a worker thread, see :func:`verify_matroska_async`.
+
+    file_path (str):
+        Path to the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return await asyncio.to_thread(verify_recognized, file_path, mkvmerge_path)
+
+
+async def verify_supported_async(file_path, mkvmerge_path="mkvmerge"):
+    """Verify a file is supported by mkvmerge, without blocking the event loop.
+
+    Runs :func:`verify_supported` in a worker thread, see :func:`verify_matroska_async`.
+
+    file_path (str):
+        Path to the file to be verified.
+    mkvmerge_path (str):
+        Alternate path to mkvmerge if it is not already in the $PATH variable.
+    """
+    return await asyncio.to_thread(verify_supported, file_path, mkvmerge_path)
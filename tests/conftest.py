@@ -1,8 +1,108 @@
+import json
+import subprocess
 from pathlib import Path
 
 import pytest
 from pytest_mock import MockerFixture
 
+from pymkv.file import MKVFile
+from pymkv.track import MKVTrack
+from pymkv.utils import clear_identify_cache
+from pymkv.verifications import clear_mkvmerge_cache
+
+# Sample files in tests/samples, by the short name used in the fixtures below
+_SAMPLE_NAMES = {
+    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 -c:v libx264 -preset ultrafast -crf 30 test_sample.mkv
+    "x264_mkv": "test_sample_x264.mkv",
+    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 -c:v libx264 -preset ultrafast -crf 30 test_sample.mp4
+    "x264_mp4": "test_sample_x264.mp4",
+    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 \
+    #        -f lavfi -i "sine=frequency=440:duration=5" \
+    #        -c:v libx264 -preset ultrafast -crf 30 \
+    #        -c:a aac test_with_audio.mkv
+    #
+    # Produces a 5s MKV with one video track and one synthetic audio track (440Hz sine).
+    "with_audio": "test_with_audio.mkv",
+    # mkvmerge -o test_with_chapters.mkv test_sample_x264.mkv --chapters chapters.xml
+    #
+    # Produces an MKV with two chapters: "Intro" and "Main Part".
+    "with_chapters": "test_with_chapters.mkv",
+    # mkvmerge -o test_with_tags.mkv test_sample_x264.mkv --global-tags tags.xml
+    #
+    # Produces an MKV with a global TITLE tag.
+    "with_tags": "test_with_tags.mkv",
+    # mkvmerge -o test_with_subs.mkv test_sample_x264.mkv --language 0:eng subs.srt
+    #
+    # Produces an MKV with one video track and one English subtitle track.
+    "with_subs": "test_with_subs.mkv",
+}
+
+
+_VIDEO_TRACK = {"id": 0, "codec": "AVC/H.264/MPEG-4p10", "type": "video", "properties": {}}
+_MATROSKA = {"type": "Matroska", "recognized": True, "supported": True, "properties": {}}
+
+# Canned mkvmerge -J output of each sample, serialized once, for tests that do not run the real mkvmerge
+_SAMPLE_IDENTIFICATIONS = {
+    file_name: json.dumps(info).encode()
+    for file_name, info in {
+        "test_sample_x264.mkv": {"container": _MATROSKA, "tracks": [_VIDEO_TRACK]},
+        "test_sample_x264.mp4": {
+            "container": {"type": "QuickTime/MP4", "recognized": True, "supported": True, "properties": {}},
+            "tracks": [_VIDEO_TRACK],
+        },
+        "test_with_audio.mkv": {
+            "container": _MATROSKA,
+            "tracks": [_VIDEO_TRACK, {"id": 1, "codec": "AAC", "type": "audio", "properties": {}}],
+        },
+        "test_with_chapters.mkv": {"container": _MATROSKA, "tracks": [_VIDEO_TRACK]},
+        "test_with_tags.mkv": {"container": _MATROSKA, "tracks": [_VIDEO_TRACK]},
+        "test_with_subs.mkv": {
+            "container": _MATROSKA,
+            "tracks": [
+                _VIDEO_TRACK,
+                {"id": 1, "codec": "SubRip/SRT", "type": "subtitles", "properties": {"language": "eng"}},
+            ],
+        },
+    }.items()
+}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "real_mkvmerge: run the installed mkvmerge instead of canned output")
+
+
+def _canned_mkvmerge(command: list[str]) -> bytes:
+    if command[1:] == ["-V"]:
+        return b"mkvmerge v90.0 ('Hanging On') 64-bit\n"
+    if command[1] == "-J" and Path(command[2]).name in _SAMPLE_IDENTIFICATIONS:
+        return _SAMPLE_IDENTIFICATIONS[Path(command[2]).name]
+    # mkvmerge exits with 2 for files it cannot open
+    raise subprocess.CalledProcessError(2, command)
+
+
+def _with_canned_mkvmerge(build, *args):
+    """
+    Calls build(*args) with the canned mkvmerge output and the on disk cache disabled. Session-scoped fixtures are set
+    up before the function-scoped mock_mkvmerge and clear_identification_cache, so they install both themselves.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(subprocess, "check_output", _canned_mkvmerge)
+        monkeypatch.delenv("PYMKV_CACHE", raising=False)
+        return build(*args)
+
+
+@pytest.fixture(autouse=True)
+def mock_mkvmerge(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """
+    Replaces mkvmerge with canned output for the samples, unless the test is marked with real_mkvmerge. Tests that
+    patch subprocess.check_output themselves take precedence.
+
+    The canned output is installed as a plain function with monkeypatch, so the tests that never look at the calls do
+    not pay for building a MagicMock.
+    """
+    if request.node.get_closest_marker("real_mkvmerge") is None:
+        monkeypatch.setattr(subprocess, "check_output", _canned_mkvmerge)
+
 
 @pytest.fixture(scope="session")
 def sample_dir() -> Path:
@@ -10,50 +110,82 @@ def sample_dir() -> Path:
 
 
 @pytest.fixture(scope="session")
-def sample_x264_mkv_file(sample_dir: Path) -> Path:
-    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 -c:v libx264 -preset ultrafast -crf 30 test_sample.mkv
-    return sample_dir / "test_sample_x264.mkv"
+def samples(sample_dir: Path) -> dict[str, Path]:
+    return {name: sample_dir / file_name for name, file_name in _SAMPLE_NAMES.items()}
 
 
 @pytest.fixture(scope="session")
-def sample_x264_mp4_file(sample_dir: Path) -> Path:
-    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 -c:v libx264 -preset ultrafast -crf 30 test_sample.mp4
-    return sample_dir / "test_sample_x264.mp4"
+def sample_x264_mkv_file(samples: dict[str, Path]) -> Path:
+    return samples["x264_mkv"]
 
 
 @pytest.fixture(scope="session")
-def sample_with_audio_file(sample_dir: Path) -> Path:
-    # ffmpeg -f lavfi -i testsrc2=duration=5:size=320x240:rate=1 \
-    #        -f lavfi -i "sine=frequency=440:duration=5" \
-    #        -c:v libx264 -preset ultrafast -crf 30 \
-    #        -c:a aac test_with_audio.mkv
-    #
-    # Produces a 5s MKV with one video track and one synthetic audio track (440Hz sine).
-    return sample_dir / "test_with_audio.mkv"
+def sample_x264_mp4_file(samples: dict[str, Path]) -> Path:
+    return samples["x264_mp4"]
 
 
 @pytest.fixture(scope="session")
-def sample_with_chapters_file(sample_dir: Path) -> Path:
-    # mkvmerge -o test_with_chapters.mkv test_sample_x264.mkv --chapters chapters.xml
-    #
-    # Produces an MKV with two chapters: "Intro" and "Main Part".
-    return sample_dir / "test_with_chapters.mkv"
+def sample_with_audio_file(samples: dict[str, Path]) -> Path:
+    return samples["with_audio"]
 
 
 @pytest.fixture(scope="session")
-def sample_with_tags_file(sample_dir: Path) -> Path:
-    # mkvmerge -o test_with_tags.mkv test_sample_x264.mkv --global-tags tags.xml
-    #
-    # Produces an MKV with a global TITLE tag.
-    return sample_dir / "test_with_tags.mkv"
+def sample_with_chapters_file(samples: dict[str, Path]) -> Path:
+    return samples["with_chapters"]
 
 
 @pytest.fixture(scope="session")
-def sample_with_subs_file(sample_dir: Path) -> Path:
-    # mkvmerge -o test_with_subs.mkv test_sample_x264.mkv --language 0:eng subs.srt
-    #
-    # Produces an MKV with one video track and one English subtitle track.
-    return sample_dir / "test_with_subs.mkv"
+def sample_with_tags_file(samples: dict[str, Path]) -> Path:
+    return samples["with_tags"]
+
+
+@pytest.fixture(scope="session")
+def sample_with_subs_file(samples: dict[str, Path]) -> Path:
+    return samples["with_subs"]
+
+
+@pytest.fixture(scope="session")
+def sample_x264_identification(sample_x264_mkv_file: Path) -> dict:
+    """
+    The parsed mkvmerge -J output of the x264 sample, decoded once per session. Tests must not modify it.
+    """
+    return json.loads(_SAMPLE_IDENTIFICATIONS[sample_x264_mkv_file.name])
+
+
+@pytest.fixture(scope="session")
+def parsed_x264_mkv(sample_x264_mkv_file: Path) -> MKVFile:
+    """
+    The x264 sample opened as an MKVFile from the canned mkvmerge output, once per session. Tests must not modify it.
+    """
+    return _with_canned_mkvmerge(MKVFile, str(sample_x264_mkv_file))
+
+
+@pytest.fixture(scope="session")
+def parsed_with_audio_mkv(sample_with_audio_file: Path) -> MKVFile:
+    """
+    The video and audio sample opened as an MKVFile from the canned mkvmerge output, once per session. Tests must not
+    modify it.
+    """
+    return _with_canned_mkvmerge(MKVFile, str(sample_with_audio_file))
+
+
+@pytest.fixture(scope="session")
+def parsed_x264_track(sample_x264_mkv_file: Path) -> MKVTrack:
+    """
+    The video track of the x264 sample as an MKVTrack from the canned mkvmerge output, once per session. Tests must not
+    modify it.
+    """
+    return _with_canned_mkvmerge(MKVTrack, str(sample_x264_mkv_file))
+
+
+@pytest.fixture(scope="session")
+def dummy_attachment_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Creates a dummy file to be used as an attachment, once per session since no test changes its contents.
+    """
+    file_path = tmp_path_factory.mktemp("attachment", numbered=False) / "attachment.txt"
+    file_path.write_text("This is a test attachment.")
+    return file_path
 
 
 @pytest.fixture
@@ -64,3 +196,17 @@ def mock_mkvmerge_verification(mocker: MockerFixture):
     """
     # The patch is applied when the fixture starts and removed when the class finishes.
     mocker.patch("pymkv.verifications.verify_mkvmerge", return_value=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_identification_cache(monkeypatch: pytest.MonkeyPatch):
+    """
+    Clears the cached mkvmerge version and identification output, so patched output from one test is not seen by
+    another. The on disk cache is disabled unless a test enables it.
+    """
+    monkeypatch.delenv("PYMKV_CACHE", raising=False)
+    clear_mkvmerge_cache()
+    clear_identify_cache()
+    yield
+    clear_mkvmerge_cache()
+    clear_identify_cache()
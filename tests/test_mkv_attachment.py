@@ -5,14 +5,6 @@ import pytest
 from pymkv.attachment import MKVAttachment
 
 
-@pytest.fixture
-def dummy_attachment_file(tmp_path: Path) -> Path:
-    """Create a dummy file to be used as an attachment."""
-    file_path = tmp_path / "attachment.txt"
-    file_path.write_text("This is a test attachment.")
-    return file_path
-
-
 class TestMKVAttachment:
     """Tests for the MKVAttachment class."""
 
@@ -45,16 +37,17 @@ class TestMKVAttachment:
         """
         Test that initializing with a non-existent file path raises FileNotFoundError.
         """
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="does not exist"):
             MKVAttachment("nonexistent/file.txt")
 
-    def test_file_path_setter(self, dummy_attachment_file: Path, tmp_path: Path):
+    def test_file_path_setter(self, dummy_attachment_file: Path):
         """
         Test the file_path property setter with a valid new path.
         """
         attachment = MKVAttachment(str(dummy_attachment_file), name="Old Name")
 
-        new_file = tmp_path / "new_attachment.jpg"
+        # a second, uniquely named file in the shared attachment directory
+        new_file = dummy_attachment_file.parent / "new_attachment.jpg"
         new_file.touch()
 
         attachment.file_path = str(new_file)
@@ -68,5 +61,89 @@ class TestMKVAttachment:
         Test that setting file_path to a non-existent file raises FileNotFoundError.
         """
         attachment = MKVAttachment(str(dummy_attachment_file))
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="does not exist"):
             attachment.file_path = "nonexistent/new_file.txt"
+        # the failed assignment leaves the attachment unchanged
+        assert attachment.file_path == str(dummy_attachment_file)
+
+
+class TestMKVAttachmentCommand:
+    """Tests for the MKVAttachment command generation."""
+
+    @pytest.mark.parametrize(
+        ("options", "expected_options", "attach_flag"),
+        [
+            pytest.param({"mime_type": None}, [], "--attach-file", id="minimal"),
+            pytest.param(
+                {"mime_type": None, "name": "Name"},
+                ["--attachment-name", "Name"],
+                "--attach-file",
+                id="name",
+            ),
+            pytest.param(
+                {"mime_type": None, "description": "Description"},
+                ["--attachment-description", "Description"],
+                "--attach-file",
+                id="description",
+            ),
+            pytest.param({}, ["--attachment-mime-type", "text/plain"], "--attach-file", id="mime_type"),
+            pytest.param({"mime_type": None, "attach_once": True}, [], "--attach-file-once", id="attach_once"),
+            pytest.param(
+                {"name": "Name", "description": "Description", "attach_once": True},
+                [
+                    "--attachment-name",
+                    "Name",
+                    "--attachment-description",
+                    "Description",
+                    "--attachment-mime-type",
+                    "text/plain",
+                ],
+                "--attach-file-once",
+                id="all_options",
+            ),
+        ],
+    )
+    def test_command(
+        self,
+        dummy_attachment_file: Path,
+        options: dict,
+        expected_options: list[str],
+        attach_flag: str,
+    ):
+        """
+        Test the command contains exactly the options that are set, followed by the attached file.
+        """
+        attachment = MKVAttachment(str(dummy_attachment_file))
+        for attribute, value in options.items():
+            setattr(attachment, attribute, value)
+
+        assert attachment.command() == [*expected_options, attach_flag, str(dummy_attachment_file)]
+
+    def test_command_updates_after_change(self, dummy_attachment_file: Path):
+        """
+        Test a regenerated command reflects attributes changed after a previous call.
+        """
+        attachment = MKVAttachment(str(dummy_attachment_file))
+        assert attachment.command() == [
+            "--attachment-mime-type",
+            "text/plain",
+            "--attach-file",
+            str(dummy_attachment_file),
+        ]
+
+        attachment.name = "Name"
+        attachment.attach_once = True
+        command = attachment.command()
+
+        assert command[:2] == ["--attachment-name", "Name"]
+        assert command[-2:] == ["--attach-file-once", str(dummy_attachment_file)]
+
+    def test_command_is_a_copy(self, dummy_attachment_file: Path):
+        """
+        Test mutating a returned command does not affect later calls.
+        """
+        attachment = MKVAttachment(str(dummy_attachment_file))
+        expected = attachment.command()
+        attachment.command().append("--extra")
+
+        assert attachment.command() == expected
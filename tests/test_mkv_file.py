@@ -1,15 +1,304 @@
+import json
+import subprocess
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import pytest
+from pytest_mock import MockerFixture
+
+from pymkv.attachment import MKVAttachment
 from pymkv.file import MKVFile
+from pymkv.timestamp import Timestamp
+
+# mkvmerge -J output for a titled file with one video and one English audio track, serialized once for every test
+_VIDEO_AUDIO_INFO = json.dumps(
+    {
+        "container": {"type": "Matroska", "recognized": True, "supported": True, "properties": {"title": "Sample"}},
+        "tracks": [
+            {"id": 0, "codec": "AVC/H.264/MPEG-4p10", "type": "video", "properties": {}},
+            {"id": 1, "codec": "AAC", "type": "audio", "properties": {"language": "eng"}},
+        ],
+    },
+).encode()
 
 
 class TestFileInit:
-    def test_basic_init(self, sample_x264_mkv_file: Path) -> None:
-        mkv_file = MKVFile(str(sample_x264_mkv_file))
+    def test_basic_init(self, parsed_x264_mkv: MKVFile, sample_x264_identification: dict) -> None:
+        assert len(parsed_x264_mkv.tracks) == len(sample_x264_identification["tracks"]) == 1
+        assert parsed_x264_mkv.tracks[0].track_codec == sample_x264_identification["tracks"][0]["codec"]
+
+    def test_basic_init_2_tracks(self, parsed_with_audio_mkv: MKVFile) -> None:
+        assert len(parsed_with_audio_mkv.tracks) == 2
 
-        assert len(mkv_file.tracks) == 1
+    @pytest.mark.usefixtures("mock_mkvmerge_verification")
+    def test_init_identifies_once(self, mocker: MockerFixture, sample_with_audio_file: Path) -> None:
+        mocker.patch("pymkv.file.verify_mkvmerge", return_value=True)
+        mock_check_output = mocker.patch("subprocess.check_output", return_value=_VIDEO_AUDIO_INFO)
 
-    def test_basic_init_2_tracks(self, sample_with_audio_file: Path) -> None:
         mkv_file = MKVFile(str(sample_with_audio_file))
 
-        assert len(mkv_file.tracks) == 2
+        assert mkv_file.title == "Sample"
+        assert [track.track_type for track in mkv_file.tracks] == ["video", "audio"]
+        assert mkv_file.tracks[1].language == "eng"
+        mock_check_output.assert_called_once_with(["mkvmerge", "-J", str(sample_with_audio_file)])
+
+
+class TestSplitTimestamps:
+    def test_split_timestamps(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_timestamps([Timestamp.from_seconds(60), Timestamp(120, 500_000_000)])
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", "timestamps:00:01:00,00:02:00.5"]
+
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            pytest.param([60, 120.5], id="seconds"),
+            pytest.param(["00:01:00", "2:00.5"], id="strings"),
+            pytest.param([Timestamp.from_seconds(60), "00:02:00.5"], id="mixed"),
+        ],
+    )
+    def test_split_timestamps_str_and_int(self, timestamps: list) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_timestamps(timestamps)
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", "timestamps:00:01:00,00:02:00.5"]
+
+    @pytest.mark.parametrize(
+        "timestamps",
+        [
+            pytest.param(["00:02:00", 60], id="not_increasing"),
+            pytest.param(["not-a-timestamp"], id="malformed_string"),
+        ],
+    )
+    def test_split_timestamps_invalid_str_and_int(self, timestamps: list) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(ValueError, match="are not properly formatted timestamps"):
+            mkv_file.split_timestamps(timestamps)
+
+    @pytest.mark.parametrize(
+        "seconds",
+        [
+            pytest.param([120, 60], id="not_increasing"),
+            pytest.param([60, 60], id="duplicate"),
+        ],
+    )
+    def test_split_timestamps_invalid(self, seconds: list[int]) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(ValueError, match="are not properly formatted timestamps"):
+            mkv_file.split_timestamps([Timestamp.from_seconds(second) for second in seconds])
+
+
+class TestSplitFramesChapters:
+    def test_split_frames(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_frames(100, [200, 300])
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", "frames:100,200,300"]
+
+    def test_split_chapters(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_chapters(1, 3, 5)
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", "chapters:1,3,5"]
+
+    @pytest.mark.parametrize(
+        ("chapters", "error"),
+        [
+            pytest.param([1, "3"], TypeError, id="not_int"),
+            pytest.param([1, 0, 3], ValueError, id="not_positive"),
+            pytest.param([3, 1], ValueError, id="not_increasing"),
+        ],
+    )
+    def test_split_chapters_invalid(self, chapters: list, error: type[Exception]) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(error):
+            mkv_file.split_chapters(chapters)
+
+
+class TestSplitDuration:
+    @pytest.mark.parametrize(
+        ("duration", "expected"),
+        [
+            pytest.param(90, "duration:00:01:30", id="int"),
+            pytest.param(90.5, "duration:00:01:30.5", id="float"),
+        ],
+    )
+    def test_split_duration(self, duration: float, expected: str) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_duration(duration)
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", expected]
+
+    def test_split_duration_link(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_duration(90, link=True)
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-3:] == ["--split", "duration:00:01:30", "--link"]
+
+    def test_split_none(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_duration(90)
+        mkv_file.split_none()
+
+        assert mkv_file.command("output.mkv", subprocess=True) == ["mkvmerge", "-o", "output.mkv"]
+
+
+class TestSplitParts:
+    def test_split_timestamp_parts(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_timestamp_parts([[None, 60], [120, 180, 240, None]])
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == [
+            "--split",
+            "parts:-00:01:00,00:02:00-00:03:00,+00:04:00-",
+        ]
+
+    def test_split_timestamp_parts_not_increasing(self) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(ValueError, match="are not properly formatted parts"):
+            mkv_file.split_timestamp_parts([[60, 120], [90, 180]])
+
+    def test_split_timestamp_parts_inner_none(self) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(ValueError, match="are not properly formatted parts"):
+            mkv_file.split_timestamp_parts([[60, None], [120, 180]])
+
+    def test_split_parts_frames(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.split_parts_frames([[None, 100], [200, 300, 400, None]])
+
+        assert mkv_file.command("output.mkv", subprocess=True)[-2:] == ["--split", "parts:-100,200-300,+400-"]
+
+    def test_split_parts_frames_odd_set(self) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(ValueError, match="is not a properly formatted set"):
+            mkv_file.split_parts_frames([[100, 200, 300]])
+
+    def test_split_parts_frames_not_int(self) -> None:
+        mkv_file = MKVFile()
+
+        with pytest.raises(TypeError, match="not an int"):
+            mkv_file.split_parts_frames([[100, "200"]])
+
+
+class TestMux:
+    @pytest.fixture
+    def mock_run(self, mocker: MockerFixture) -> MagicMock:
+        mocker.patch("pymkv.file.verify_mkvmerge", return_value=True)
+        return mocker.patch("subprocess.run")
+
+    def test_mux(self, mock_run: MagicMock, capsys: pytest.CaptureFixture[str]) -> None:
+        mkv_file = MKVFile(title="Title")
+
+        mkv_file.mux("output.mkv")
+
+        expected = ["mkvmerge", "-o", "output.mkv", "--title", "Title"]
+        mock_run.assert_called_once_with(expected, check=True, capture_output=True)
+        assert " ".join(expected) in capsys.readouterr().out
+
+    def test_mux_silent(self, mock_run: MagicMock, capsys: pytest.CaptureFixture[str]) -> None:
+        mkv_file = MKVFile(title="Title")
+
+        mkv_file.mux("output.mkv", silent=True)
+
+        expected = ["mkvmerge", "-o", "output.mkv", "--title", "Title"]
+        mock_run.assert_called_once_with(expected, stdout=subprocess.DEVNULL, check=True)
+        assert capsys.readouterr().out == ""
+
+
+class TestStripMetadata:
+    @staticmethod
+    def _tracks() -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(no_chapters=False, no_global_tags=False, no_track_tags=False, no_attachments=False)
+            for _ in range(2)
+        ]
+
+    def test_strip_metadata(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.tracks = self._tracks()
+
+        mkv_file.strip_metadata()
+
+        for track in mkv_file.tracks:
+            assert track.no_chapters
+            assert track.no_global_tags
+            assert track.no_track_tags
+            assert track.no_attachments
+
+    def test_strip_metadata_subset(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.tracks = self._tracks()
+
+        mkv_file.strip_metadata(global_tags=False, attachments=False)
+
+        for track in mkv_file.tracks:
+            assert track.no_chapters
+            assert not track.no_global_tags
+            assert track.no_track_tags
+            assert not track.no_attachments
+
+    def test_no_methods(self) -> None:
+        mkv_file = MKVFile()
+        mkv_file.tracks = self._tracks()
+
+        mkv_file.no_chapters()
+        mkv_file.no_attachments()
+
+        for track in mkv_file.tracks:
+            assert track.no_chapters
+            assert not track.no_global_tags
+            assert not track.no_track_tags
+            assert track.no_attachments
+
+
+class TestCommand:
+    def test_command_with_attachments(self, tmp_path: Path) -> None:
+        attachment_file = tmp_path / "cover.jpg"
+        attachment_file.touch()
+        mkv_file = MKVFile()
+        mkv_file.add_attachment(str(attachment_file))
+        mkv_file.add_attachment(MKVAttachment(str(attachment_file), attach_once=True))
+
+        assert mkv_file.command("output.mkv", subprocess=True) == [
+            "mkvmerge",
+            "-o",
+            "output.mkv",
+            "--attachment-mime-type",
+            "image/jpeg",
+            "--attach-file",
+            str(attachment_file),
+            "--attachment-mime-type",
+            "image/jpeg",
+            "--attach-file-once",
+            str(attachment_file),
+        ]
+
+    def test_command_string(self) -> None:
+        mkv_file = MKVFile(title="Title")
+
+        assert mkv_file.command("output.mkv") == "mkvmerge -o output.mkv --title Title"
+
+    def test_command_with_links(self, mocker: MockerFixture) -> None:
+        mocker.patch("pymkv.file.verify_matroska", return_value=True)
+        mkv_file = MKVFile()
+        mkv_file.link_to_previous("previous.mkv")
+        mkv_file.link_to_next("next.mkv")
+
+        assert mkv_file.command("output.mkv", subprocess=True)[3:] == [
+            "--link-to-previous",
+            "=previous.mkv",
+            "--link-to-next",
+            "=next.mkv",
+        ]
+
+        mkv_file.link_to_none()
+        assert mkv_file.command("output.mkv", subprocess=True) == ["mkvmerge", "-o", "output.mkv"]
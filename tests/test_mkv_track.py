@@ -1,16 +1,138 @@
-# tests/test_MKVTrack.py
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
 
 from pymkv.track import MKVTrack
 
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+# mkvmerge -J output for a file with one video and one audio track, serialized once for every test
+_VIDEO_AUDIO_INFO = json.dumps(
+    {
+        "container": {"type": "Matroska", "recognized": True, "supported": True},
+        "tracks": [
+            {"id": 0, "codec": "AVC/H.264/MPEG-4p10", "type": "video", "properties": {}},
+            {"id": 1, "codec": "AAC", "type": "audio", "properties": {}},
+        ],
+    },
+).encode()
+
 
 class TestTrackInit:
-    def test_basic_init(self, sample_x264_mkv_file: Path) -> None:
-        track = MKVTrack(str(sample_x264_mkv_file))
+    def test_basic_init(self, parsed_x264_track: MKVTrack, sample_x264_identification: dict) -> None:
+        track = parsed_x264_track
+        info = sample_x264_identification["tracks"][0]
 
         assert track.file_path
         assert track.track_id == 0
-        assert track.track_codec == "AVC/H.264/MPEG-4p10"
-        assert track.track_type == "video"
+        assert track.track_codec == info["codec"]
+        assert track.track_type == info["type"] == "video"
+
+
+@pytest.mark.usefixtures("mock_mkvmerge_verification")
+class TestTrackCommand:
+    @pytest.fixture
+    def mock_identification(self, mocker: MockerFixture) -> MagicMock:
+        return mocker.patch("subprocess.check_output", return_value=_VIDEO_AUDIO_INFO)
+
+    @pytest.mark.usefixtures("mock_identification")
+    def test_command_video(self, sample_with_audio_file: Path) -> None:
+        track = MKVTrack(str(sample_with_audio_file))
+
+        assert track.command() == [
+            "--default-track",
+            "0:0",
+            "--forced-track",
+            "0:0",
+            "-d",
+            "0",
+            "-A",
+            "-S",
+            str(sample_with_audio_file),
+        ]
+
+    @pytest.mark.usefixtures("mock_identification")
+    def test_command_audio_with_options(self, sample_with_audio_file: Path) -> None:
+        track = MKVTrack(str(sample_with_audio_file), track_id=1, track_name="Name", language="eng")
+        track.default_track = True
+        track.no_chapters = True
+        track.no_attachments = True
+
+        assert track.command() == [
+            "--track-name",
+            "1:Name",
+            "--language",
+            "1:eng",
+            "--default-track",
+            "1:1",
+            "--forced-track",
+            "1:0",
+            "-D",
+            "-a",
+            "1",
+            "-S",
+            "--no-chapters",
+            "--no-attachments",
+            str(sample_with_audio_file),
+        ]
+
+    @pytest.mark.usefixtures("mock_identification")
+    def test_repr(self, sample_with_audio_file: Path) -> None:
+        track = MKVTrack(str(sample_with_audio_file), track_name="Name")
+
+        assert not hasattr(track, "__dict__")
+        assert "'track_name': 'Name'" in repr(track)
+        assert "'_track_type': 'video'" in repr(track)
+        assert "_info_json" not in repr(track)
+        assert "_type_flags" not in repr(track)
+        assert "_id_str" not in repr(track)
+
+    @pytest.mark.usefixtures("mock_identification")
+    def test_language_validator(self, monkeypatch: pytest.MonkeyPatch, sample_with_audio_file: Path) -> None:
+        monkeypatch.setattr(MKVTrack, "_language_validator", staticmethod(lambda _language: False))
+        track = MKVTrack(str(sample_with_audio_file))
+
+        with pytest.raises(ValueError, match="not an ISO639-2 language code"):
+            track.language = "eng"
+        assert track.language is None
+
+    def test_unsupported_file(self, monkeypatch: pytest.MonkeyPatch, sample_with_audio_file: Path) -> None:
+        monkeypatch.setattr("pymkv.track.verify_supported", lambda _file_path: False)
+
+        with pytest.raises(ValueError, match="is not a supported file") as excinfo:
+            MKVTrack(str(sample_with_audio_file))
+        assert str(sample_with_audio_file) in str(excinfo.value)
+
+    def test_track_id_reuses_identification(self, mock_identification: MagicMock, sample_with_audio_file: Path) -> None:
+        track = MKVTrack(str(sample_with_audio_file))
+        calls = mock_identification.call_count
+
+        track.track_id = 1
+
+        assert track.track_type == "audio"
+        assert mock_identification.call_count == calls
+
+    def test_command_subtitles(self, sample_with_subs_file: Path) -> None:
+        track = MKVTrack(str(sample_with_subs_file), track_id=1, language="eng")
+
+        assert track.track_type == "subtitles"
+        assert track.command() == [
+            "--language",
+            "1:eng",
+            "--default-track",
+            "1:0",
+            "--forced-track",
+            "1:0",
+            "-D",
+            "-A",
+            "-s",
+            "1",
+            str(sample_with_subs_file),
+        ]
@@ -1,6 +1,12 @@
 import pytest
 
 from pymkv.timestamp import Timestamp
+from pymkv.timestamp import format_seconds
+
+
+def _parsed_pair(ts1_str: str, ts2_str: str, *values: object, id: str):  # noqa: A002
+    """Parametrize with two timestamps parsed once at collection, rather than in every test run."""
+    return pytest.param(Timestamp.from_string(ts1_str), Timestamp.from_string(ts2_str), *values, id=id)
 
 
 class TestInitialization:
@@ -34,6 +40,47 @@ class TestInitialization:
         with pytest.raises(ValueError):
             Timestamp.from_string("not-a-timestamp")
 
+    @pytest.mark.parametrize(
+        "timestamp_str",
+        [
+            pytest.param("45", id="single_field"),
+            pytest.param("01:02:03:04", id="too_many_fields"),
+            pytest.param("001:02:03", id="too_many_digits"),
+            pytest.param("01::03", id="empty_field"),
+            pytest.param("01:02:03.", id="empty_fraction"),
+            pytest.param("01:02:03.1234567890", id="fraction_too_long"),
+            pytest.param("01:02.3.4", id="multiple_fractions"),
+            pytest.param("01:02:0³", id="non_ascii_digit"),
+            pytest.param(" 1:02:03", id="leading_space"),
+            pytest.param("01:02:03.+1", id="signed_fraction"),
+            pytest.param("01:02:03.1_2", id="underscore_fraction"),
+        ],
+    )
+    def test_init_with_malformed_string(self, timestamp_str: str):
+        """Test that strings outside the HH:MM:SS.nnnnnnnnn grammar raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid timestamp format"):
+            Timestamp.from_string(timestamp_str)
+
+    @pytest.mark.parametrize(
+        ("timestamp_str", "expected"),
+        [
+            pytest.param("01:23:45", (1, 23, 45, 0), id="whole_seconds"),
+            pytest.param("01:23:45.5", (1, 23, 45, 500000000), id="short_fraction"),
+            pytest.param("99:59:59.000000001", (99, 59, 59, 1), id="full_fraction"),
+        ],
+    )
+    def test_init_with_canonical_string(self, timestamp_str: str, expected: tuple[int, int, int, int]):
+        """Test the fixed HH:MM:SS[.n] layout parses to the same fields as the general scanner."""
+        assert tuple(Timestamp.from_string(timestamp_str)) == expected
+
+    def test_init_with_single_digit_fields(self):
+        """Test initializing Timestamp with single digit fields and a short fraction."""
+        ts = Timestamp.from_string("1:2:3.5")
+        assert ts.hh == 1
+        assert ts.mm == 2
+        assert ts.ss == 3
+        assert ts.nn == 500000000
+
     def test_init_with_invalid_type(self):
         """Test that initializing with an unsupported type raises TypeError."""
         with pytest.raises(TypeError):
@@ -62,54 +109,48 @@ class TestComparisons:
     """Tests for the comparison methods of the Timestamp class."""
 
     @pytest.mark.parametrize(
-        ("ts1_str", "ts2_str", "is_equal"),
+        ("ts1", "ts2", "is_equal"),
         [
-            pytest.param("01:01:01.1", "01:01:01.100000000", True, id="equal_different_ns_precision"),
-            pytest.param("01:01:01.1", "01:01:01.2", False, id="unequal_ns"),
-            pytest.param("01:01:01.0", "01:01:02.0", False, id="unequal_seconds"),
-            pytest.param("01:01:00.0", "01:02:00.0", False, id="unequal_minutes"),
-            pytest.param("01:00:00.0", "02:00:00.0", False, id="unequal_hours"),
+            _parsed_pair("01:01:01.1", "01:01:01.100000000", True, id="equal_different_ns_precision"),
+            _parsed_pair("01:01:01.1", "01:01:01.2", False, id="unequal_ns"),
+            _parsed_pair("01:01:01.0", "01:01:02.0", False, id="unequal_seconds"),
+            _parsed_pair("01:01:00.0", "01:02:00.0", False, id="unequal_minutes"),
+            _parsed_pair("01:00:00.0", "02:00:00.0", False, id="unequal_hours"),
         ],
     )
-    def test_eq_ne(self, ts1_str: str, ts2_str: str, is_equal: bool):
+    def test_eq_ne(self, ts1: Timestamp, ts2: Timestamp, is_equal: bool):
         """Test equality (==) and inequality (!=) comparisons."""
-        ts1 = Timestamp.from_string(ts1_str)
-        ts2 = Timestamp.from_string(ts2_str)
         assert (ts1 == ts2) is is_equal
         assert (ts1 != ts2) is not is_equal
 
     @pytest.mark.parametrize(
-        ("ts_smaller_str", "ts_larger_str"),
+        ("ts_smaller", "ts_larger"),
         [
-            pytest.param("01:01:01.1", "01:01:01.2", id="compare_ns"),
-            pytest.param("01:01:01.9", "01:01:02.0", id="compare_seconds"),
-            pytest.param("01:01:59.0", "01:02:00.0", id="compare_minutes"),
-            pytest.param("01:59:00.0", "02:00:00.0", id="compare_hours"),
+            _parsed_pair("01:01:01.1", "01:01:01.2", id="compare_ns"),
+            _parsed_pair("01:01:01.9", "01:01:02.0", id="compare_seconds"),
+            _parsed_pair("01:01:59.0", "01:02:00.0", id="compare_minutes"),
+            _parsed_pair("01:59:00.0", "02:00:00.0", id="compare_hours"),
         ],
     )
-    def test_lt_gt(self, ts_smaller_str: str, ts_larger_str: str):
+    def test_lt_gt(self, ts_smaller: Timestamp, ts_larger: Timestamp):
         """Test less than (<) and greater than (>) comparisons."""
-        ts_smaller = Timestamp.from_string(ts_smaller_str)
-        ts_larger = Timestamp.from_string(ts_larger_str)
         assert ts_smaller < ts_larger
         assert ts_larger > ts_smaller
         assert not (ts_larger < ts_smaller)
         assert not (ts_smaller > ts_larger)
 
     @pytest.mark.parametrize(
-        ("ts_smaller_str", "ts_larger_str"),
+        ("ts_smaller", "ts_larger"),
         [
-            pytest.param("01:01:01.1", "01:01:01.2", id="less_than"),
-            pytest.param("01:01:01.1", "01:01:01.1", id="equal_to"),
+            _parsed_pair("01:01:01.1", "01:01:01.2", id="less_than"),
+            _parsed_pair("01:01:01.1", "01:01:01.1", id="equal_to"),
         ],
     )
-    def test_le_ge(self, ts_smaller_str: str, ts_larger_str: str):
+    def test_le_ge(self, ts_smaller: Timestamp, ts_larger: Timestamp):
         """Test less than or equal to (<=) and greater than or equal to (>=)."""
-        ts_smaller = Timestamp.from_string(ts_smaller_str)
-        ts_larger = Timestamp.from_string(ts_larger_str)
         assert ts_smaller <= ts_larger
         assert ts_larger >= ts_smaller
-        if ts_smaller_str != ts_larger_str:
+        if ts_smaller != ts_larger:
             assert not (ts_larger <= ts_smaller)
             assert not (ts_smaller >= ts_larger)
 
@@ -121,3 +162,94 @@ class TestDunderMethods:
         """Test the __str__ method."""
         ts = Timestamp.from_string("12:34:56.789")
         assert str(ts) == "12:34:56.789"
+
+    @pytest.mark.parametrize(
+        ("timestamp_str", "expected"),
+        [
+            pytest.param("00:00:01.000500", "00:00:01.0005", id="leading_zeros"),
+            pytest.param("00:00:01.000000001", "00:00:01.000000001", id="single_nanosecond"),
+            pytest.param("00:00:01.100000000", "00:00:01.1", id="trailing_zeros"),
+        ],
+    )
+    def test_str_fraction(self, timestamp_str: str, expected: str):
+        """Test the fraction keeps its leading zeros and drops its trailing ones."""
+        assert str(Timestamp.from_string(timestamp_str)) == expected
+
+    def test_str_is_stable(self):
+        """Test repeated __str__ calls return the same formatted value."""
+        ts = Timestamp.from_string("00:00:01.5")
+        assert str(ts) == "00:00:01.5"
+        assert str(ts) == "00:00:01.5"
+
+    def test_eq_other_type(self):
+        """Test equality against a non-Timestamp defers to the other operand and falls back to unequal."""
+        ts = Timestamp.from_seconds(1)
+        assert ts.__eq__("00:00:01") is NotImplemented
+        assert ts != 1
+        assert ts != "00:00:01"
+
+    @pytest.mark.parametrize("other", [1, "00:00:01", None])
+    def test_ordering_other_type(self, other: object):
+        """Test ordering against a non-Timestamp raises the usual TypeError."""
+        ts = Timestamp.from_seconds(1)
+        with pytest.raises(TypeError):
+            ts < other  # noqa: B015
+        with pytest.raises(TypeError):
+            ts >= other  # noqa: B015
+
+    def test_hash(self):
+        """Test equal timestamps hash equally so they can be used in sets and dict keys."""
+        ts1 = Timestamp.from_string("01:01:01.1")
+        ts2 = Timestamp.from_string("01:01:01.100000000")
+        assert hash(ts1) == hash(ts2)
+        assert len({ts1, ts2}) == 1
+
+
+class TestFormatSeconds:
+    """Tests for the format_seconds helper."""
+
+    @pytest.mark.parametrize("seconds", [0, 59, 60, 3599, 3600, 5025, 360000])
+    def test_matches_timestamp_str(self, seconds: int):
+        """Test format_seconds agrees with str() of the equivalent Timestamp."""
+        assert format_seconds(seconds) == str(Timestamp(seconds))
+
+    def test_from_seconds_cached(self):
+        """Test repeated from_seconds calls share one immutable Timestamp."""
+        assert Timestamp.from_seconds(60) is Timestamp.from_seconds(60)
+        assert Timestamp.from_seconds(60.5) != Timestamp.from_seconds(60)
+
+    def test_from_seconds_integral_float(self):
+        """Test a float without a fractional part has no nanoseconds."""
+        ts = Timestamp.from_seconds(90.0)
+        assert ts.nn == 0
+        assert str(ts) == "00:01:30"
+
+
+class TestGetItem:
+    """Tests for indexing into a Timestamp."""
+
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [
+            pytest.param(0, 1, id="hours"),
+            pytest.param(1, 23, id="minutes"),
+            pytest.param(2, 45, id="seconds"),
+            pytest.param(3, 123456789, id="nanoseconds"),
+            pytest.param(-1, 123456789, id="negative"),
+        ],
+    )
+    def test_getitem(self, index: int, expected: int):
+        """Test each field can be read by index."""
+        ts = Timestamp.from_string("01:23:45.123456789")
+        assert ts[index] == expected
+
+    def test_getitem_out_of_range(self):
+        """Test indexing past the nanoseconds raises IndexError."""
+        ts = Timestamp.from_string("01:23:45.123456789")
+        with pytest.raises(IndexError):
+            ts[4]
+
+    def test_unpack(self):
+        """Test a Timestamp unpacks into its four fields."""
+        hh, mm, ss, nn = Timestamp.from_string("01:23:45.5")
+        assert (hh, mm, ss, nn) == (1, 23, 45, 500000000)
@@ -0,0 +1,129 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pymkv import _identcache
+from pymkv.utils import batch_identify
+from pymkv.utils import clear_identify_cache
+from pymkv.utils import identify
+from pymkv.utils import is_iso_639_2_language_code
+
+
+class TestLanguageCode:
+    @pytest.mark.parametrize(
+        ("language", "expected"),
+        [
+            pytest.param("eng", True, id="terminology_code"),
+            pytest.param("fra", True, id="french"),
+            pytest.param("en", False, id="two_letter_code"),
+            pytest.param("xyz", False, id="unknown_code"),
+        ],
+    )
+    def test_is_iso_639_2_language_code(self, language: str, *, expected: bool) -> None:
+        assert is_iso_639_2_language_code(language) is expected
+
+    def test_iso639_not_imported_with_package(self) -> None:
+        code = "import sys, pymkv; sys.exit('iso639' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0  # noqa: S603
+
+
+class TestIdentify:
+    def test_identify(self, mocker: MockerFixture) -> None:
+        info = {"container": {"type": "Matroska"}, "tracks": []}
+        mock_check_output = mocker.patch("subprocess.check_output", return_value=json.dumps(info).encode())
+
+        assert identify("video.mkv", mkvmerge_path="/opt/mkvmerge") == info
+        mock_check_output.assert_called_once_with(["/opt/mkvmerge", "-J", "video.mkv"])
+
+    @pytest.mark.real_mkvmerge
+    @pytest.mark.skipif(shutil.which("mkvmerge") is None, reason="mkvmerge is not installed")
+    def test_identify_real_mkvmerge(self, sample_x264_mkv_file: Path) -> None:
+        """Integration check that the canned output used elsewhere matches what the installed mkvmerge reports."""
+        info = identify(str(sample_x264_mkv_file))
+
+        assert info["container"]["type"] == "Matroska"
+        assert [track["type"] for track in info["tracks"]] == ["video"]
+
+    def test_identify_is_cached(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        video = tmp_path / "video.mkv"
+        video.write_bytes(b"first")
+        mock_check_output = mocker.patch("subprocess.check_output", return_value=b"{}")
+
+        identify(str(video))
+        identify(str(video))
+        assert mock_check_output.call_count == 1
+
+        # a rewritten file is identified again
+        video.write_bytes(b"rewritten")
+        identify(str(video))
+        assert mock_check_output.call_count == 2
+
+    def test_identify_missing_file_is_not_cached(self, mocker: MockerFixture) -> None:
+        mock_check_output = mocker.patch("subprocess.check_output", return_value=b"{}")
+
+        identify("/does/not/exist.mkv")
+        identify("/does/not/exist.mkv")
+        assert mock_check_output.call_count == 2
+
+
+class TestBatchIdentify:
+    def test_batch_identify(self, mocker: MockerFixture) -> None:
+        def check_output(command: list[str]) -> bytes:
+            return json.dumps({"file_name": command[-1]}).encode()
+
+        mocker.patch("subprocess.check_output", side_effect=check_output)
+        paths = [f"/does/not/exist/{index}.mkv" for index in range(8)]
+
+        results = batch_identify(paths, max_workers=4)
+
+        assert [result["file_name"] for result in results] == paths
+
+    def test_batch_identify_error(self, mocker: MockerFixture) -> None:
+        mocker.patch("subprocess.check_output", side_effect=subprocess.CalledProcessError(2, "mkvmerge"))
+
+        with pytest.raises(subprocess.CalledProcessError):
+            batch_identify(["/does/not/exist.mkv"])
+
+
+class TestPersistentCache:
+    @pytest.fixture
+    def cache_home(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("PYMKV_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        yield tmp_path / "cache"
+        _identcache.close()
+
+    def test_identification_persists(self, mocker: MockerFixture, tmp_path: Path, cache_home: Path) -> None:
+        video = tmp_path / "video.mkv"
+        video.write_bytes(b"video")
+        mock_check_output = mocker.patch("subprocess.check_output", return_value=b'{"tracks": []}')
+
+        assert identify(str(video)) == {"tracks": []}
+        # a new process starts with an empty in memory cache
+        clear_identify_cache()
+        _identcache.close()
+        assert identify(str(video)) == {"tracks": []}
+
+        assert mock_check_output.call_count == 1
+        assert (cache_home / "pymkv" / "identify.sqlite3").is_file()
+
+    def test_disabled_by_default(
+        self,
+        mocker: MockerFixture,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        cache_home: Path,
+    ) -> None:
+        monkeypatch.delenv("PYMKV_CACHE")
+        video = tmp_path / "video.mkv"
+        video.write_bytes(b"video")
+        mocker.patch("subprocess.check_output", return_value=b"{}")
+
+        identify(str(video))
+
+        assert not cache_home.exists()
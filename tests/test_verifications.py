@@ -1,3 +1,4 @@
+import asyncio
 import json
 import subprocess
 from pathlib import Path
@@ -6,9 +7,12 @@ import pytest
 from pytest_mock import MockerFixture
 
 from pymkv.verifications import verify_matroska
+from pymkv.verifications import verify_matroska_async
 from pymkv.verifications import verify_mkvmerge
 from pymkv.verifications import verify_recognized
+from pymkv.verifications import verify_recognized_async
 from pymkv.verifications import verify_supported
+from pymkv.verifications import verify_supported_async
 
 
 class TestVerifyMkvmerge:
@@ -85,6 +89,28 @@ class TestVerifyMkvmerge:
 
         assert result is True
 
+    def test_verify_mkvmerge_success_is_cached(self, mocker: MockerFixture):
+        """
+        Test a working mkvmerge is only run once.
+        """
+        mock_check_output = mocker.patch("subprocess.check_output")
+        mock_check_output.return_value = b"mkvmerge v1.2.3 ('test') 64-bit\n"
+
+        assert verify_mkvmerge() is True
+        assert verify_mkvmerge() is True
+
+        mock_check_output.assert_called_once_with(["mkvmerge", "-V"])
+
+    def test_verify_mkvmerge_failure_is_not_cached(self, mocker: MockerFixture):
+        """
+        Test a missing mkvmerge is looked for again, in case it has been installed since.
+        """
+        mock_check_output = mocker.patch("subprocess.check_output")
+        mock_check_output.side_effect = [FileNotFoundError(), b"mkvmerge v1.2.3 ('test') 64-bit\n"]
+
+        assert verify_mkvmerge() is False
+        assert verify_mkvmerge() is True
+
 
 @pytest.mark.usefixtures("mock_mkvmerge_verification")
 class TestVerifyMatroska:
@@ -125,11 +151,16 @@ class TestVerifyMatroska:
         assert result is True
         mock_check_output.assert_called_once_with(["mkvmerge", "-J", str(sample_x264_mkv_file)])
 
-    def test_verify_matroska_false_for_non_matroska(self, mocker, sample_x264_mp4_file: Path, mock_non_matroska_info):
+    def test_verify_matroska_false_for_non_matroska(
+        self,
+        monkeypatch,
+        sample_x264_mp4_file: Path,
+        mock_non_matroska_info,
+    ):
         """Test Matroska verification returns False for non-Matroska files."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_non_matroska_info).encode()
+        output = json.dumps(mock_non_matroska_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_matroska(str(sample_x264_mp4_file))
 
@@ -147,18 +178,18 @@ class TestVerifyMatroska:
         assert result is True
         mock_check_output.assert_called_once_with([custom_path, "-J", str(sample_x264_mkv_file)])
 
-    def test_verify_matroska_mkvmerge_not_found(self, mocker, sample_x264_mkv_file: Path):
+    def test_verify_matroska_mkvmerge_not_found(self, monkeypatch, sample_x264_mkv_file: Path):
         """Test Matroska verification when mkvmerge not found."""
-        mocker.patch("pymkv.verifications.verify_mkvmerge", return_value=False)
+        monkeypatch.setattr("pymkv.verifications.verify_mkvmerge", lambda **_kwargs: False)
 
         with pytest.raises(FileNotFoundError, match="mkvmerge is not at the specified path"):
             verify_matroska(str(sample_x264_mkv_file))
 
-    def test_verify_matroska_pathlike_input(self, mocker, sample_x264_mkv_file: Path, mock_mkvmerge_info):
+    def test_verify_matroska_pathlike_input(self, monkeypatch, sample_x264_mkv_file: Path, mock_mkvmerge_info):
         """Test Matroska verification with PathLike input."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_mkvmerge_info).encode()
+        output = json.dumps(mock_mkvmerge_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_matroska(sample_x264_mkv_file)  # Pass Path object directly
 
@@ -176,6 +207,12 @@ class TestVerifyMatroska:
         with pytest.raises(FileNotFoundError, match="does not exist"):
             verify_matroska("/nonexistent/file.mkv")
 
+    def test_verify_matroska_directory(self, tmp_path: Path):
+        """Test Matroska verification rejects a path that exists but is not a regular file."""
+
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            verify_matroska(str(tmp_path))
+
     def test_verify_matroska_subprocess_error(self, mocker, sample_x264_mkv_file: Path):
         """Test Matroska verification when subprocess fails."""
 
@@ -185,12 +222,12 @@ class TestVerifyMatroska:
         with pytest.raises(ValueError, match="could not be opened"):
             verify_matroska(str(sample_x264_mkv_file))
 
-    def test_verify_matroska_expanduser(self, mocker, mock_mkvmerge_info):
+    def test_verify_matroska_expanduser(self, mocker, mock_mkvmerge_info, sample_x264_mkv_file: Path):
         """Test Matroska verification expands user path."""
 
         mock_check_output = mocker.patch("subprocess.check_output")
         mock_check_output.return_value = json.dumps(mock_mkvmerge_info).encode()
-        _ = mocker.patch("pymkv.verifications.isfile", return_value=True)
+        _ = mocker.patch("pymkv.verifications.os.stat", return_value=sample_x264_mkv_file.stat())
         mock_expanduser = mocker.patch("pymkv.verifications.expanduser", return_value="/home/user/video.mkv")
 
         verify_matroska("~/video.mkv")
@@ -223,29 +260,29 @@ class TestVerifyRecognized:
             },
         }
 
-    def test_verify_recognized_true(self, mocker, sample_x264_mkv_file: Path, mock_recognized_info):
+    def test_verify_recognized_true(self, monkeypatch, sample_x264_mkv_file: Path, mock_recognized_info):
         """Test verify_recognized returns True for recognized file."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_recognized_info).encode()
+        output = json.dumps(mock_recognized_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_recognized(str(sample_x264_mkv_file))
 
         assert result is True
 
-    def test_verify_recognized_false(self, mocker, sample_x264_mkv_file: Path, mock_unrecognized_info):
+    def test_verify_recognized_false(self, monkeypatch, sample_x264_mkv_file: Path, mock_unrecognized_info):
         """Test verify_recognized returns False for unrecognized file."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_unrecognized_info).encode()
+        output = json.dumps(mock_unrecognized_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_recognized(str(sample_x264_mkv_file))
 
         assert result is False
 
-    def test_verify_recognized_mkvmerge_not_found(self, mocker, sample_x264_mkv_file: Path):
+    def test_verify_recognized_mkvmerge_not_found(self, monkeypatch, sample_x264_mkv_file: Path):
         """Test verify_recognized when mkvmerge not found."""
-        mocker.patch("pymkv.verifications.verify_mkvmerge", return_value=False)
+        monkeypatch.setattr("pymkv.verifications.verify_mkvmerge", lambda **_kwargs: False)
 
         with pytest.raises(FileNotFoundError, match="mkvmerge is not at the specified path"):
             verify_recognized(str(sample_x264_mkv_file))
@@ -296,29 +333,29 @@ class TestVerifySupported:
             },
         }
 
-    def test_verify_supported_true(self, mocker, sample_x264_mkv_file: Path, mock_supported_info):
+    def test_verify_supported_true(self, monkeypatch, sample_x264_mkv_file: Path, mock_supported_info):
         """Test verify_supported returns True for supported file."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_supported_info).encode()
+        output = json.dumps(mock_supported_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_supported(str(sample_x264_mkv_file))
 
         assert result is True
 
-    def test_verify_supported_false(self, mocker, sample_x264_mkv_file: Path, mock_unsupported_info):
+    def test_verify_supported_false(self, monkeypatch, sample_x264_mkv_file: Path, mock_unsupported_info):
         """Test verify_supported returns False for unsupported file."""
 
-        mock_check_output = mocker.patch("subprocess.check_output")
-        mock_check_output.return_value = json.dumps(mock_unsupported_info).encode()
+        output = json.dumps(mock_unsupported_info).encode()
+        monkeypatch.setattr(subprocess, "check_output", lambda _command: output)
 
         result = verify_supported(str(sample_x264_mkv_file))
 
         assert result is False
 
-    def test_verify_supported_mkvmerge_not_found(self, mocker, sample_x264_mkv_file: Path):
+    def test_verify_supported_mkvmerge_not_found(self, monkeypatch, sample_x264_mkv_file: Path):
         """Test verify_supported when mkvmerge not found."""
-        mocker.patch("pymkv.verifications.verify_mkvmerge", return_value=False)
+        monkeypatch.setattr("pymkv.verifications.verify_mkvmerge", lambda **_kwargs: False)
 
         with pytest.raises(FileNotFoundError, match="mkvmerge is not at the specified path"):
             verify_supported(str(sample_x264_mkv_file))
@@ -354,3 +391,43 @@ class TestVerifySupported:
         # doesn't include the file_path in the format string
         with pytest.raises(ValueError, match="could not be opened"):
             verify_supported(str(sample_x264_mkv_file))
+
+
+@pytest.mark.usefixtures("mock_mkvmerge_verification")
+class TestVerifyCombined:
+    """Tests for checking several properties of the same file."""
+
+    def test_identifies_once(self, mocker: MockerFixture, sample_x264_mkv_file: Path):
+        """Test back to back verifications of a file only run mkvmerge once."""
+        info = {"container": {"type": "Matroska", "recognized": True, "supported": True}}
+        mock_check_output = mocker.patch("subprocess.check_output")
+        mock_check_output.return_value = json.dumps(info).encode()
+
+        assert verify_matroska(sample_x264_mkv_file) is True
+        assert verify_recognized(sample_x264_mkv_file) is True
+        assert verify_supported(str(sample_x264_mkv_file)) is True
+
+        mock_check_output.assert_called_once_with(["mkvmerge", "-J", str(sample_x264_mkv_file)])
+
+
+@pytest.mark.usefixtures("mock_mkvmerge_verification")
+class TestVerifyAsync:
+    """Tests for the asyncio variants of the verify functions."""
+
+    def test_gather(self, sample_x264_mkv_file: Path, sample_x264_mp4_file: Path):
+        """Test the async variants return the same results as the blocking functions."""
+
+        async def verify_all():
+            return await asyncio.gather(
+                verify_matroska_async(sample_x264_mkv_file),
+                verify_matroska_async(sample_x264_mp4_file),
+                verify_recognized_async(sample_x264_mp4_file),
+                verify_supported_async(str(sample_x264_mkv_file)),
+            )
+
+        assert asyncio.run(verify_all()) == [True, False, True, True]
+
+    def test_error(self):
+        """Test errors from the blocking function are raised by the awaited call."""
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            asyncio.run(verify_supported_async("/nonexistent/file.mkv"))